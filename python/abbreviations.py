@@ -4,6 +4,7 @@ Financial Term Matching System - Abbreviation Mappings
 Comprehensive abbreviation expansion dictionary for financial terms.
 """
 
+from functools import lru_cache
 from typing import Dict, List, Set
 
 # Core financial abbreviations
@@ -175,10 +176,14 @@ SIGN_CONVENTION_INDICATORS: Dict[str, int] = {
     'debit': 1,
 }
 
+@lru_cache(maxsize=4096)
 def expand_abbreviations(text: str) -> str:
     """
     Expand all known abbreviations in text.
     
+    Results are cached: statement labels and words repeat heavily, and the
+    multi-word pass runs one regex substitution per known phrase.
+    
     Args:
         text: Input text potentially containing abbreviations
         
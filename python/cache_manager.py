@@ -8,6 +8,7 @@ Reduces API calls and enables offline access to previously searched companies.
 import json
 import logging
 import os
+import tempfile
 import time
 from typing import Dict, List, Optional, Any
 from pathlib import Path
@@ -24,13 +25,18 @@ class CompanySearchCache:
     """
     Simple JSON-based cache for company search results.
     Caches search queries and their results to reduce API calls.
+    
+    Args:
+        cache_file: JSON file backing the cache (default: shared search cache)
+        cache_duration: Seconds before an entry expires
     """
     
-    def __init__(self):
-        self.cache_dir = CACHE_DIR
-        self.cache_file = CACHE_FILE
-        self.cache_duration = CACHE_DURATION
+    def __init__(self, cache_file: Optional[Path] = None, cache_duration: int = CACHE_DURATION):
+        self.cache_file = cache_file or CACHE_FILE
+        self.cache_dir = self.cache_file.parent
+        self.cache_duration = cache_duration
         self._cache: Dict[str, Any] = {}
+        self._mtime: Optional[int] = None
         self._ensure_cache_dir()
         self._load_cache()
     
@@ -41,22 +47,52 @@ class CompanySearchCache:
         except Exception as e:
             logger.error(f"Error creating cache directory: {e}")
     
+    def _file_mtime(self) -> Optional[int]:
+        """Modification time of the cache file in nanoseconds, or None if missing"""
+        try:
+            return self.cache_file.stat().st_mtime_ns
+        except OSError:
+            return None
+    
     def _load_cache(self):
         """Load cache from disk"""
         try:
-            if self.cache_file.exists():
+            self._mtime = self._file_mtime()
+            if self._mtime is not None:
                 with open(self.cache_file, 'r') as f:
-                    self._cache = json.load(f)
+                    data = json.load(f)
+                self._cache = data if isinstance(data, dict) else {}
                 logger.info(f"Loaded {len(self._cache)} cached search results")
         except Exception as e:
             logger.error(f"Error loading cache: {e}")
             self._cache = {}
     
+    def _refresh(self):
+        """Reload the cache if another process has rewritten the file since it was read"""
+        mtime = self._file_mtime()
+        if mtime is not None and mtime != self._mtime:
+            self._load_cache()
+    
     def _save_cache(self):
-        """Save cache to disk"""
+        """
+        Save cache to disk.
+        
+        Writes a private (0600) temporary file and renames it over the cache
+        file, so readers in other processes never see a partial write.
+        """
         try:
-            with open(self.cache_file, 'w') as f:
-                json.dump(self._cache, f, indent=2)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.cache_dir, prefix=self.cache_file.name, suffix='.tmp'
+            )
+            try:
+                with os.fdopen(fd, 'w') as f:
+                    json.dump(self._cache, f, indent=2)
+                os.replace(tmp_path, self.cache_file)
+            except Exception:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+                raise
+            self._mtime = self._file_mtime()
         except Exception as e:
             logger.error(f"Error saving cache: {e}")
     
@@ -72,11 +108,18 @@ class CompanySearchCache:
         """
         query_key = query.lower().strip()
         
+        # Another process may have cached it since the file was read
         if query_key not in self._cache:
-            return None
+            self._refresh()
+            if query_key not in self._cache:
+                return None
         
         entry = self._cache[query_key]
-        timestamp = entry.get('timestamp', 0)
+        timestamp = entry.get('timestamp', 0) if isinstance(entry, dict) else None
+        
+        # Entries with an unexpected shape count as misses
+        if not isinstance(timestamp, (int, float)):
+            return None
         
         # Check if cache entry is expired
         if time.time() - timestamp > self.cache_duration:
@@ -98,6 +141,8 @@ class CompanySearchCache:
         """
         query_key = query.lower().strip()
         
+        # Pick up entries other processes wrote, so saving does not drop them
+        self._refresh()
         self._cache[query_key] = {
             'timestamp': time.time(),
             'results': results
@@ -106,6 +151,19 @@ class CompanySearchCache:
         self._save_cache()
         logger.info(f"Cached {len(results)} results for query: {query}")
     
+    def delete(self, query: str):
+        """
+        Remove the cached results for a query.
+        
+        Args:
+            query: Search query string
+        """
+        query_key = query.lower().strip()
+        
+        self._refresh()
+        if self._cache.pop(query_key, None) is not None:
+            self._save_cache()
+    
     def clear(self):
         """Clear all cached results"""
         self._cache = {}
@@ -901,3 +901,8 @@ class OCRProcessor:
         """Clear OCR cache."""
         self.cache.clear()
         logger.info("OCR cache cleared")
+    
+    def reset(self):
+        """Clear cached pages and statistics before a new document, keeping the engine."""
+        self.cache.clear()
+        self._stats.clear()
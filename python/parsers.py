@@ -2,7 +2,9 @@
 from typing import Optional, Dict, List, Any, Set, Tuple
 import logging
 import json
+import csv
 import traceback
+import threading
 import sys
 import re
 from pathlib import Path
@@ -95,6 +97,17 @@ SKIP_PATTERNS = [
     r'^nil\s*$',
 ]
 
+# Excel sheet-name keywords for statement/entity detection, one alternation
+# per group. Matched as substrings of the lowercased name, so concatenated
+# names like "Balancesheet" or "ProfitLoss" are still classified.
+SHEET_BALANCE_RE = re.compile(r'balance|position|assets')
+SHEET_INCOME_RE = re.compile(r'profit|loss|income|p&l')
+SHEET_CASH_FLOW_RE = re.compile(r'cash|flow')
+SHEET_STANDALONE_RE = re.compile(r'standalone|separate')
+
+# Page delimiter emitted by the markdown converter ("--- Page 12 ---")
+_MD_PAGE_DELIMITER_RE = re.compile(r'--- Page\s*\d+\s*---\r?\n?')
+
 def should_skip_line(line: str) -> bool:
     """Check if line should be skipped (page numbers, headers, etc)."""
     line_lower = line.lower().strip()
@@ -201,6 +214,60 @@ def is_garbage_label(label: str) -> bool:
     
     return False
 
+def read_text_file(file_path: str) -> str:
+    """
+    Read a text-based document (TXT/CSV/MD/XBRL) in one binary read.
+
+    Bypasses the TextIOWrapper line buffering and decodes the payload once;
+    undecodable bytes are replaced rather than aborting the whole parse.
+    """
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    return data.decode('utf-8', errors='replace')
+
+def _make_item_dict(
+    item_id: str,
+    label: str,
+    current_year: float,
+    previous_year: float,
+    *,
+    statement_type: str,
+    reporting_entity: str,
+    source_page: int,
+    is_total: bool,
+) -> Dict[str, Any]:
+    """
+    Build a line-item dict for the flat-file loaders (Excel/CSV/XBRL).
+    
+    Produces the same keys and rounding as FinancialLineItem.to_dict()
+    without the dataclass round-trip for every row.
+    """
+    variation = current_year - previous_year
+    if previous_year == 0:
+        variation_percent = 0.0 if current_year == 0 else None
+    else:
+        variation_percent = round((variation / abs(previous_year)) * 100, 2)
+    
+    return {
+        "id": item_id,
+        "label": label,
+        "currentYear": round(current_year, 2),
+        "previousYear": round(previous_year, 2),
+        "variation": round(variation, 2),
+        "variationPercent": variation_percent,
+        "statementType": statement_type,
+        "reportingEntity": reporting_entity,
+        "section": "",
+        "noteRef": "",
+        "indentLevel": 0,
+        "isTotal": is_total,
+        "isSubtotal": False,
+        "isImportant": False,
+        "sourcePage": f"Page {source_page}" if source_page > 0 else "",
+        "rawLine": "",
+        "allYears": {},
+    }
+
 def is_important_item(label: str) -> bool:
     """Check if item is important based on terminology matches."""
     # Simplified check: if it matches a key term with high boost or metrics
@@ -303,6 +370,10 @@ class FinancialParser:
         self._validation_issues: List[ValidationIssue] = []
         # Cache for converted pages to avoid re-conversion
         self.markdown_cache: Dict[int, str] = {}
+        # The OCR cache is keyed by path and page, so a reused parser must not
+        # carry it (or its statistics) over to the next document
+        if self._ocr_processor is not None:
+            self._ocr_processor.reset()
     
     @property
     def ocr_processor(self) -> Optional[OCRProcessor]:
@@ -1715,6 +1786,21 @@ class FinancialParser:
         rows_data = defaultdict(list)
         for cell in graph.cells:
             rows_data[cell.row_idx].append(cell)
+        
+        # Statement type / entity are the same for every row of the graph
+        source_stmt_type = graph.source_table.statement_type
+        stmt_type_str = sys.intern(
+            source_stmt_type.value if hasattr(source_stmt_type, 'value') else str(source_stmt_type)
+        )
+        entity_str = sys.intern(reporting_entity.value)
+        
+        # Column lookups and period keys are per-graph, not per-cell.
+        # Period keys are interned so the all_years dicts share key objects.
+        col_by_idx = {c.index: c for c in graph.columns}
+        year_key_by_idx = {
+            c.index: sys.intern(str(c.period_label or c.period_date or ''))
+            for c in graph.columns
+        }
             
         for row_idx, cells in rows_data.items():
             if not cells: continue
@@ -1722,7 +1808,7 @@ class FinancialParser:
             # Assume all cells in a row share the same Header & Section
             first_cell = cells[0]
             label = first_cell.row_header
-            section = first_cell.section
+            section = sys.intern(first_cell.section or '')
             
             # Match Terminology for the Row
             matched_term = self._match_terminology(label)
@@ -1735,6 +1821,10 @@ class FinancialParser:
                 std_label = label
                 is_important = False
             
+            # Drop noise rows before doing any per-cell work
+            if is_garbage_label(std_label):
+                continue
+            
             # Determine Values
             current_val = 0.0
             previous_val = 0.0
@@ -1746,12 +1836,13 @@ class FinancialParser:
                  val = cell.value * cell.sign
                  
                  # Check classification
-                 col_meta = next((c for c in graph.columns if c.index == cell.col_idx), None)
+                 col_meta = col_by_idx.get(cell.col_idx)
                  if col_meta:
-                     # Store in all_years if we have a label/date
-                     year_key = col_meta.period_label or col_meta.period_date
+                     # Store in all_years if we have a label/date; several cells
+                     # can map to the same period, so accumulate rather than overwrite
+                     year_key = year_key_by_idx[cell.col_idx]
                      if year_key:
-                         all_years_val[year_key] = val
+                         all_years_val[year_key] = all_years_val.get(year_key, 0.0) + val
 
                      if col_meta.column_type == 'amount_current':
                          current_val = val
@@ -1761,16 +1852,13 @@ class FinancialParser:
             if current_val == 0 and previous_val == 0:
                 continue
                 
-            if is_garbage_label(std_label):
-                continue
-                
             item = FinancialLineItem(
                 id=term_id,
                 label=std_label,
                 current_year=current_val,
                 previous_year=previous_val,
-                statement_type=graph.source_table.statement_type.value if hasattr(graph.source_table.statement_type, 'value') else str(graph.source_table.statement_type),
-                reporting_entity=reporting_entity.value,
+                statement_type=stmt_type_str,
+                reporting_entity=entity_str,
                 section=section,
                 note_ref=first_cell.note_ref,
                 source_page=graph.source_table.page_num,
@@ -1855,9 +1943,13 @@ class FinancialParser:
         ocr_map: Dict[int, OCRResult]
     ) -> Dict[str, Any]:
         """Build metadata dictionary."""
+        # Fixed shape: every statement slot exists up front and is only mutated
         detected = {
-            "standalone": {},
-            "consolidated": {},
+            entity: {
+                stmt: {"found": False}
+                for stmt in ("balanceSheet", "incomeStatement", "cashFlow")
+            }
+            for entity in ("standalone", "consolidated")
         }
         
         stmt_type_map = {
@@ -1871,50 +1963,36 @@ class FinancialParser:
             stmt_name = stmt_type_map.get(boundary.identifier.statement_type)
             
             if entity in detected and stmt_name:
-                detected[entity][stmt_name] = {
-                    "found": True,
-                    "pages": [p + 1 for p in boundary.pages],
-                    "title": boundary.title,
-                    "confidence": round(boundary.confidence, 2)
-                }
+                slot = detected[entity][stmt_name]
+                slot["found"] = True
+                slot["pages"] = [p + 1 for p in boundary.pages]
+                slot["title"] = boundary.title
+                slot["confidence"] = round(boundary.confidence, 2)
         
         # OCR statistics
         ocr_stats = {}
         if self.ocr_processor:
             ocr_stats = self.ocr_processor.get_statistics()
         
-        # Build year labels dictionary
-        year_labels_dict = {
-            entity: labels
-            for entity, labels in self.year_labels.items()
-        }
-        
-        # Determine global primary years for the UI
-        primary_current = ""
-        primary_previous = ""
-        
-        # Preference order for primary labels
-        if "standalone" in year_labels_dict:
-            primary_current = year_labels_dict["standalone"]["current"]
-            primary_previous = year_labels_dict["standalone"]["previous"]
-        elif "consolidated" in year_labels_dict:
-            primary_current = year_labels_dict["consolidated"]["current"]
-            primary_previous = year_labels_dict["consolidated"]["previous"]
-        elif year_labels_dict:
-            first_entity_labels = next(iter(year_labels_dict.values()))
-            primary_current = first_entity_labels["current"]
-            primary_previous = first_entity_labels["previous"]
+        # Determine global primary years for the UI.
+        # Preference order: standalone, consolidated, then any other entity.
+        year_labels = self.year_labels
+        primary_current, primary_previous = (
+            year_labels.get("standalone")
+            or year_labels.get("consolidated")
+            or next(iter(year_labels.values()), ("", ""))
+        )
 
         return {
             "totalPages": len(doc),
             "detectedStatements": detected,
-            "yearLabels": year_labels_dict,
+            "yearLabels": year_labels,
             "currentYear": primary_current,
             "previousYear": primary_previous,
             "tablesExtracted": len(self.extracted_tables),
             "ocr": ocr_stats,
-            "hasStandalone": bool(detected.get("standalone")),
-            "hasConsolidated": bool(detected.get("consolidated")),
+            "hasStandalone": any(slot["found"] for slot in detected["standalone"].values()),
+            "hasConsolidated": any(slot["found"] for slot in detected["consolidated"].values()),
             "debugInfo": self.debug_info if self.config.include_debug_info else [],
         }
     
@@ -1989,15 +2067,22 @@ class FinancialParser:
         if not bs_items:
             return
         
-        def find_total(items: List[Dict], keywords: List[str]) -> Optional[float]:
-            for item in items:
-                label_lower = item.get('label', '').lower()
-                if any(kw in label_lower for kw in keywords):
-                    return item.get('currentYear')
-            return None
-        
-        total_assets = find_total(bs_items, ['total assets'])
-        total_liab_eq = find_total(bs_items, ['total equity and liabilities', 'total liabilities and equity'])
+        # Single pass: take the first match for each total and stop once both are found
+        liab_eq_keywords = ('total equity and liabilities', 'total liabilities and equity')
+        total_assets = None
+        total_liab_eq = None
+        found_assets = found_liab_eq = False
+        
+        for item in bs_items:
+            label_lower = item.get('label', '').lower()
+            if not found_assets and 'total assets' in label_lower:
+                total_assets = item.get('currentYear')
+                found_assets = True
+            if not found_liab_eq and any(kw in label_lower for kw in liab_eq_keywords):
+                total_liab_eq = item.get('currentYear')
+                found_liab_eq = True
+            if found_assets and found_liab_eq:
+                break
         
         if total_assets is not None and total_liab_eq is not None:
             diff = abs(total_assets - total_liab_eq)
@@ -2036,17 +2121,17 @@ class FinancialParser:
                 # Detect entity from sheet name
                 if 'consolidated' in sheet_lower:
                     entity = ReportingEntity.CONSOLIDATED
-                elif 'standalone' in sheet_lower or 'separate' in sheet_lower:
+                elif SHEET_STANDALONE_RE.search(sheet_lower):
                     entity = ReportingEntity.STANDALONE
                 else:
                     entity = ReportingEntity.STANDALONE
                 
                 # Detect statement type
-                if any(kw in sheet_lower for kw in ['balance', 'position', 'assets']):
+                if SHEET_BALANCE_RE.search(sheet_lower):
                     stmt_type = StatementType.BALANCE_SHEET
-                elif any(kw in sheet_lower for kw in ['profit', 'loss', 'income', 'p&l']):
+                elif SHEET_INCOME_RE.search(sheet_lower):
                     stmt_type = StatementType.INCOME_STATEMENT
-                elif any(kw in sheet_lower for kw in ['cash', 'flow']):
+                elif SHEET_CASH_FLOW_RE.search(sheet_lower):
                     stmt_type = StatementType.CASH_FLOW
                 else:
                     stmt_type = StatementType.UNKNOWN
@@ -2078,23 +2163,13 @@ class FinancialParser:
                             entity_prefix = entity.value[:4]
                             item_id = self._generate_id(label, entity_prefix)
                             
-                            item = FinancialLineItem(
-                                id=item_id,
-                                label=label,
-                                current_year=curr,
-                                previous_year=prev,
+                            item_dict = _make_item_dict(
+                                item_id, label, curr, prev,
                                 statement_type=stmt_type.value,
                                 reporting_entity=entity.value,
-                                section="",
-                                note_ref="",
-                                indent_level=0,
-                                is_total='total' in label.lower(),
-                                is_subtotal=False,
-                                is_important=False, # Removed external dependency
                                 source_page=0,
+                                is_total='total' in label.lower(),
                             )
-                            
-                            item_dict = item.to_dict()
                             all_items.append(item_dict)
                             
                             # Store in appropriate location
@@ -2125,51 +2200,46 @@ class FinancialParser:
         result = self._create_empty_result()
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_text_file(file_path)
             
             # Detect year labels
             years = self.detector.detect_year_labels(content)
             entity = ReportingEntity.STANDALONE
             
             items = []
-            lines = content.strip().split('\n')
             
-            for line in lines:
-                if not line.strip():
+            for line in content.strip().split('\n'):
+                # Try CSV format
+                if ',' not in line:
                     continue
                 
-                # Try CSV format
-                if ',' in line:
-                    parts = [p.strip() for p in line.split(',')]
-                    if len(parts) >= 3:
-                        try:
-                            label = parts[0]
-                            curr = safe_float(parts[1])
-                            prev = safe_float(parts[2])
-                            
-                            item_id = self._generate_id(label)
-                            
-                            item = FinancialLineItem(
-                                id=item_id,
-                                label=label,
-                                current_year=curr,
-                                previous_year=prev,
-                                statement_type="unknown",
-                                reporting_entity=entity.value,
-                                section="",
-                                note_ref="",
-                                indent_level=0,
-                                is_total='total' in label.lower(),
-                                is_subtotal=False,
-                                is_important=False, # Removed external dependency
-                                source_page=1,
-                            )
-                            
-                            items.append(item.to_dict())
-                            
-                        except ValueError:
-                            continue
+                # Tokenized one line at a time so a stray quote cannot swallow
+                # the lines after it; quoted values like "1,234" stay intact
+                try:
+                    row = next(csv.reader([line], skipinitialspace=True), [])
+                except csv.Error:
+                    # NUL bytes, oversized fields: fall back to a plain split
+                    row = line.split(',')
+                
+                if len(row) >= 3:
+                    parts = [p.strip() for p in row]
+                    try:
+                        label = parts[0]
+                        curr = safe_float(parts[1])
+                        prev = safe_float(parts[2])
+                        
+                        item_id = self._generate_id(label)
+                        
+                        items.append(_make_item_dict(
+                            item_id, label, curr, prev,
+                            statement_type="unknown",
+                            reporting_entity=entity.value,
+                            source_page=1,
+                            is_total='total' in label.lower(),
+                        ))
+                        
+                    except ValueError:
+                        continue
             
             result['items'] = items
             result['standalone']['balance_sheet']['items'] = items
@@ -2190,8 +2260,7 @@ class FinancialParser:
         result = self._create_empty_result()
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_text_file(file_path)
             
             # Remove namespaces for easier parsing
             content = re.sub(r'\sxmlns(?::[a-z]+)?="[^"]+"', '', content)
@@ -2227,23 +2296,13 @@ class FinancialParser:
                         label = tag.replace('_', ' ').replace('-', ' ').title()
                         item_id = self._generate_id(tag)
                         
-                        item = FinancialLineItem(
-                            id=item_id,
-                            label=label,
-                            current_year=curr_val,
-                            previous_year=prev_val,
+                        items.append(_make_item_dict(
+                            item_id, label, curr_val, prev_val,
                             statement_type="unknown",
                             reporting_entity=entity.value,
-                            section="",
-                            note_ref="",
-                            indent_level=0,
-                            is_total='total' in tag.lower(),
-                            is_subtotal=False,
-                            is_important=False,
                             source_page=0,
-                        )
-                        
-                        items.append(item.to_dict())
+                            is_total='total' in tag.lower(),
+                        ))
                         
                     except ValueError:
                         continue
@@ -2261,8 +2320,7 @@ class FinancialParser:
         """Parse a Markdown document."""
         result = self._create_empty_result()
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            content = read_text_file(file_path)
 
             # Mock a 'doc' structure by splitting content into pages if possible
             # But since it's a flat file, we treat it as single or multiple pages if delimiter found
@@ -2284,20 +2342,9 @@ class FinancialParser:
             
             class MockDoc:
                 def __init__(self, text_content):
-                    # Split by page delimiter if present
-                    pages_text = text_content.split('--- Page')
-                    self.pages = []
-                    if len(pages_text) > 1:
-                        # Reconstruct pages
-                        for p in pages_text:
-                            if not p.strip(): continue
-                            # p might start with " 1 ---\n"
-                            clean_p = p
-                            if re.match(r'\s*\d+\s*---\n', p):
-                                clean_p = re.sub(r'^\s*\d+\s*---\n', '', p)
-                            self.pages.append(MockPage(clean_p))
-                    else:
-                        self.pages = [MockPage(text_content)]
+                    # Split by "--- Page N ---" delimiters in a single pass
+                    pages_text = [p for p in _MD_PAGE_DELIMITER_RE.split(text_content) if p.strip()]
+                    self.pages = [MockPage(p) for p in pages_text] or [MockPage(text_content)]
                         
                 def __len__(self): return len(self.pages)
                 def __getitem__(self, idx): return self.pages[idx]
@@ -2360,13 +2407,24 @@ class FinancialParser:
 # Helper Functions
 # =============================================================================
 
+# One default parser per thread. FinancialParser.parse() resets all per-document
+# state, so the instance (and its matching engine / compiled patterns) can be reused.
+_thread_local = threading.local()
+
+def _get_default_parser() -> FinancialParser:
+    """Return this thread's shared default FinancialParser."""
+    parser = getattr(_thread_local, 'parser', None)
+    if parser is None:
+        parser = FinancialParser()
+        _thread_local.parser = parser
+    return parser
+
 def parse_file(file_path: str, file_type: Optional[str] = None) -> Dict[str, Any]:
     """
     Wrapper function to parse a file using FinancialParser.
-    Creates a new parser instance for each call to ensure thread safety.
+    Reuses a per-thread parser instance, so concurrent callers never share one.
     """
-    parser = FinancialParser()
-    return parser.parse(file_path, file_type)
+    return _get_default_parser().parse(file_path, file_type)
 
 def parse_annual_report(file_path: str) -> Dict[str, Any]:
     """
@@ -5,25 +5,181 @@ Phase 1: Data Preprocessing & Normalization
 Standardizes input text to eliminate mismatch noise.
 """
 
+import multiprocessing as mp
 import re
+import sys
+import threading
 import unicodedata
-from typing import Dict, List, Tuple, Optional, Any
+from typing import Dict, List, Tuple, Optional, Any, Iterable, Iterator, Mapping, Sequence
 from dataclasses import dataclass
-from datetime import datetime
+from functools import lru_cache
 
-from abbreviations import expand_abbreviations, SIGN_CONVENTION_INDICATORS
+from abbreviations import (
+    expand_abbreviations, SIGN_CONVENTION_INDICATORS,
+    FINANCIAL_ABBREVIATIONS, MULTI_WORD_ABBREVIATIONS
+)
+
+# Optional RE2 engine (linear-time DFA matching, no backtracking)
+try:
+    import re2
+    RE2_AVAILABLE = True
+except ImportError:
+    re2 = None
+    RE2_AVAILABLE = False
+
+
+def _compile_hot_pattern(pattern: str, flags: int = 0):
+    """
+    Compile a hot-path pattern with RE2 when installed, else with stdlib re.
+    
+    Flags are passed inline so the call works with both the google-re2 and
+    pyre2 bindings. Patterns RE2 rejects fall back to stdlib re.
+    """
+    if RE2_AVAILABLE:
+        try:
+            return re2.compile(('(?i)' if flags & re.IGNORECASE else '') + pattern)
+        except Exception:
+            pass
+    return re.compile(pattern, flags)
+
+
+# Canonical-form character replacements as a str.translate table
+_CANONICAL_REPLACEMENTS = str.maketrans({
+    '\u2018': "'", '\u2019': "'", '\u201c': '"', '\u201d': '"',
+    '\u2013': ' ', '\u2014': ' ', '\u2212': ' ',
+    '\u2007': ' ', '\u2009': ' ', '\xa0': ' ',
+    '&': ' and ',
+    '/': ' ',
+    '_': ' ',
+})
+
+# Characters dropped from the canonical form: everything except word
+# characters, whitespace, periods (decimals) and dashes (ISO dates)
+_CANONICAL_FILTER_RE = re.compile(r'[^\w\s.\-]')
+
+# ASCII fast path: the replacements above plus deletion of every ASCII
+# character the canonical-form filter drops
+_ASCII_CANONICAL_TABLE = {
+    **{ord(c): None for c in map(chr, range(128)) if _CANONICAL_FILTER_RE.match(c)},
+    **{code: repl for code, repl in _CANONICAL_REPLACEMENTS.items() if code < 128},
+}
+
+# Abbreviation lookup keys drop every non-word character
+_NON_WORD_RE = re.compile(r'[^\w]')
+
+
+def _build_abbreviation_table() -> Dict[str, str]:
+    """
+    Precompute expand_abbreviations() for every punctuation-free word it changes.
+    
+    A single cleaned word can only be rewritten when it equals a dictionary key
+    (multi-word keys contain spaces and never match one word), so expanding
+    every cleaned key once yields the complete word -> expansion table.
+    """
+    table = {}
+    for key in (*FINANCIAL_ABBREVIATIONS, *MULTI_WORD_ABBREVIATIONS):
+        word = _NON_WORD_RE.sub('', key.lower())
+        expanded = expand_abbreviations(word)
+        if expanded != word:
+            table[word] = expanded
+    return table
+
+
+# Cleaned word -> expansion, used by TextPreprocessor._expand_abbreviations_in_text
+_ABBREVIATION_EXPANSIONS = _build_abbreviation_table()
+
+
+# Days per month in a common year, for date validation without datetime
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _format_iso_date(year: int, month: int, day: int) -> Optional[str]:
+    """
+    Format a calendar date as YYYY-MM-DD without building a datetime.
+    
+    Accepts exactly the dates datetime() accepts. The year is not zero-padded,
+    matching strftime('%Y') output for years below 1000.
+    
+    Returns:
+        ISO date string, or None if the date does not exist
+    """
+    if not (1 <= year <= 9999 and 1 <= month <= 12 and day >= 1):
+        return None
+    if day > _DAYS_IN_MONTH[month - 1]:
+        leap_day = (
+            month == 2 and day == 29
+            and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+        )
+        if not leap_day:
+            return None
+    return f'{year}-{month:02d}-{day:02d}'
+
+
+# Canonical forms shorter than this are interned
+INTERN_MAX_LENGTH = 64
+
+# Shared removed_elements for preprocessors built with track_removals=False.
+# A plain dict of empty tuples so results still pickle to pool workers;
+# treat it as read-only.
+_NO_REMOVALS: Mapping[str, Sequence[str]] = {
+    'notes': (), 'schedules': (), 'sign_indicators': (), 'dates': (), 'numbers': ()
+}
+
+# Distinct lines remembered per TextPreprocessor (config key 'cache_size');
+# statements repeat labels like "Total" and column headers many times
+PREPROCESS_CACHE_SIZE = 8192
 
 
 @dataclass
 class PreprocessingResult:
     """Result of text preprocessing pipeline"""
+    # Slot-only instances: one is created per preprocessed line
+    __slots__ = (
+        'original_text', 'cleaned_text', 'canonical_form', 'sign_multiplier',
+        'detected_abbreviations', 'removed_elements', 'line_number',
+    )
+    
     original_text: str
     cleaned_text: str
     canonical_form: str
     sign_multiplier: int
     detected_abbreviations: List[str]
-    removed_elements: Dict[str, List[str]]
-    metadata: Dict[str, Any]
+    removed_elements: Mapping[str, Sequence[str]]
+    line_number: Optional[int]
+    
+    @property
+    def original_length(self) -> int:
+        return len(self.original_text)
+    
+    @property
+    def cleaned_length(self) -> int:
+        return len(self.cleaned_text)
+    
+    @property
+    def canonical_length(self) -> int:
+        return len(self.canonical_form)
+    
+    @property
+    def metadata(self) -> Dict[str, Any]:
+        """Line number and text lengths, built on access rather than per line"""
+        return {
+            'line_number': self.line_number,
+            'original_length': self.original_length,
+            'cleaned_length': self.cleaned_length,
+            'canonical_length': self.canonical_length
+        }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary for JSON serialization"""
+        return {
+            'original_text': self.original_text,
+            'cleaned_text': self.cleaned_text,
+            'canonical_form': self.canonical_form,
+            'sign_multiplier': self.sign_multiplier,
+            'detected_abbreviations': self.detected_abbreviations,
+            'removed_elements': {key: list(values) for key, values in self.removed_elements.items()},
+            'metadata': self.metadata
+        }
 
 
 class TextPreprocessor:
@@ -41,31 +197,74 @@ class TextPreprocessor:
         """
         self.config = config or {}
         
+        # Record removed notes, numbers and dates on each result (config key
+        # 'track_removals'); callers that never read them can switch it off
+        self.track_removals = self.config.get('track_removals', True)
+        
+        note_references = (
+            r'\bnote\s*(?:no\.?)?\s*\d+\b|'
+            r'\(see\s+note\s*\d+\)|'
+            r'\(note\s*\d+\)|'
+            r'schedule\s*[a-z]\d*|'
+            r'\(\d+\)'
+        )
+        
         # Regex patterns for text cleaning
         self.patterns = {
-            'note_references': re.compile(
-                r'\bnote\s*(?:no\.?)?\s*\d+\b|'
-                r'\(see\s+note\s*\d+\)|'
-                r'\(note\s*\d+\)|'
-                r'schedule\s*[a-z]\d*|'
-                r'\(\d+\)',
-                re.IGNORECASE
-            ),
+            'note_references': _compile_hot_pattern(note_references, re.IGNORECASE),
             'dot_leaders': re.compile(r'\.{3,}'),
             'excess_whitespace': re.compile(r'\s+'),
-            'parenthetical_numbers': re.compile(r'\((\d{1,3}(?:,\d{3})*(?:\.\d+)?)\)'),
+            'parenthetical_numbers': _compile_hot_pattern(r'\((\d{1,3}(?:,\d{3})*(?:\.\d+)?)\)'),
+            # Matched against lowercased text
             'sign_indicators': re.compile(
-                r'^(?:less[:]?|[-]\s*\(\s*|\(cr\)|\(dr\)|cr\.|dr\.|credit|debit)',
-                re.IGNORECASE
+                r'^(?:less[:]?|[-]\s*\(\s*|\(cr\)|\(dr\)|cr\.|dr\.|credit|debit)'
             ),
-            'date_formats': re.compile(
+            'date_formats': _compile_hot_pattern(
                 r'\b(\d{1,2})[\.\-/](\d{1,2})[\.\-/](\d{2,4})\b'
             ),
             'number_formats': re.compile(
                 r'\b(\d{1,3}(?:,\d{2,3})+(?:\.\d+)?)\b'  # Indian format: 1,00,000
             ),
-            'thousand_separators': re.compile(r'(\d),(\d{3})'),
+            'unsigned_number_starts': re.compile(r'(?<=\s)(?=\d)'),
         }
+        
+        # Sign-convention prefixes: every indicator expanded into the spellings
+        # _detect_sign_convention accepts, mapped to (indicator order, multiplier)
+        self._sign_prefixes = self._build_sign_prefixes(SIGN_CONVENTION_INDICATORS)
+        self._sign_prefix_lengths = sorted({len(prefix) for prefix in self._sign_prefixes})
+        self._sign_first_chars = frozenset(prefix[0] for prefix in self._sign_prefixes)
+        
+        # Single-scan cleanup used by preprocess(): note/schedule references
+        # and parenthetical numbers in one alternation, notes taking precedence
+        # as in the separate passes. Dot leaders are replaced afterwards, since
+        # removing a reference can join two runs of dots into one leader.
+        # The main pattern is case-sensitive and runs on lowercased text; the
+        # IGNORECASE variant is only for lines whose lowercase form changes length.
+        cleanup = (
+            r'(?P<note>' + note_references + r')'
+            r'|\((?P<paren>\d{1,3}(?:,\d{3})*(?:\.\d+)?)\)'
+        )
+        self._cleanup_pattern = _compile_hot_pattern(cleanup)
+        self._cleanup_pattern_ci = _compile_hot_pattern(cleanup, re.IGNORECASE)
+        
+        # Memoized pipeline, keyed on the stripped line
+        self._init_cache()
+    
+    def _init_cache(self) -> None:
+        """Create the per-instance line cache."""
+        self._preprocess_cached = lru_cache(
+            maxsize=self.config.get('cache_size', PREPROCESS_CACHE_SIZE)
+        )(self._preprocess_line)
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cache wraps a bound method and is rebuilt after unpickling
+        state = self.__dict__.copy()
+        del state['_preprocess_cached']
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._init_cache()
     
     def preprocess(self, text: str, line_number: Optional[int] = None) -> PreprocessingResult:
         """
@@ -78,30 +277,56 @@ class TextPreprocessor:
         Returns:
             PreprocessingResult with cleaned and canonical forms
         """
-        original = text.strip()
-        removed_elements = {
-            'notes': [],
-            'schedules': [],
-            'sign_indicators': [],
-            'dates': [],
-            'numbers': []
-        }
+        cached = self._preprocess_cached(text.strip())
         
-        # Step 1: Detect sign conventions before cleaning
-        sign_multiplier = self._detect_sign_convention(original)
-        if sign_multiplier == -1:
-            removed_elements['sign_indicators'].append('negative_indicator')
+        # Fresh lists per call so callers never mutate the cached result
+        if self.track_removals:
+            removed_elements = {key: list(values) for key, values in cached.removed_elements.items()}
+        else:
+            removed_elements = _NO_REMOVALS
         
-        # Step 2: Remove note and schedule references
-        cleaned, notes_removed = self._remove_note_references(original)
-        removed_elements['notes'].extend(notes_removed)
+        return PreprocessingResult(
+            original_text=cached.original_text,
+            cleaned_text=cached.cleaned_text,
+            canonical_form=cached.canonical_form,
+            sign_multiplier=cached.sign_multiplier,
+            detected_abbreviations=list(cached.detected_abbreviations),
+            removed_elements=removed_elements,
+            line_number=line_number
+        )
+    
+    def _preprocess_line(self, original: str) -> PreprocessingResult:
+        """
+        Run the preprocessing pipeline on one stripped line (uncached).
         
-        # Step 3: Remove dot leaders and normalize whitespace
-        cleaned = self._clean_formatting(cleaned)
+        Args:
+            original: Stripped text line
+            
+        Returns:
+            PreprocessingResult without a line number
+        """
+        original_lower = original.lower()
+        
+        # Removed elements are only collected when the caller reads them
+        if self.track_removals:
+            removed_elements = {
+                'notes': [],
+                'schedules': [],
+                'sign_indicators': [],
+                'dates': [],
+                'numbers': []
+            }
+        else:
+            removed_elements = None
+        
+        # Step 1: Detect sign conventions before cleaning
+        sign_multiplier = self._detect_sign_convention(original, original_lower)
+        if sign_multiplier == -1 and removed_elements is not None:
+            removed_elements['sign_indicators'].append('negative_indicator')
         
-        # Step 4: Convert parenthetical numbers to signed format
-        cleaned, numbers_converted = self._convert_parenthetical_numbers(cleaned)
-        removed_elements['numbers'].extend(numbers_converted)
+        # Steps 2-4: Remove note/schedule references and dot leaders, convert
+        # parenthetical numbers to signed format, then lowercase and normalize whitespace
+        cleaned = self._apply_cleanup_pass(original, removed_elements, original_lower)
         
         # Step 5: Expand abbreviations
         cleaned, detected_abbr = self._expand_abbreviations_in_text(cleaned)
@@ -111,153 +336,179 @@ class TextPreprocessor:
         
         # Step 7: Normalize dates
         canonical, dates_normalized = self._normalize_dates(canonical)
-        removed_elements['dates'].extend(dates_normalized)
+        if removed_elements is not None:
+            removed_elements['dates'].extend(dates_normalized)
         
-        # Step 8: Normalize number formats
-        canonical = self._normalize_numbers(canonical)
+        # Step 8: Number formats need no separate pass here: the canonical
+        # filter already deletes every comma, thousand separators included
         
         # Step 9: Apply sign multiplier to numbers in canonical form if negative
         if sign_multiplier == -1:
             canonical = self._apply_sign_to_numbers(canonical)
         
+        # Short canonical forms repeat heavily across a document (row labels),
+        # so share one string object per distinct value
+        if len(canonical) < INTERN_MAX_LENGTH:
+            canonical = sys.intern(canonical)
+        
         return PreprocessingResult(
             original_text=original,
             cleaned_text=cleaned,
             canonical_form=canonical,
             sign_multiplier=sign_multiplier,
             detected_abbreviations=detected_abbr,
-            removed_elements=removed_elements,
-            metadata={
-                'line_number': line_number,
-                'original_length': len(original),
-                'cleaned_length': len(cleaned),
-                'canonical_length': len(canonical)
-            }
+            removed_elements=_NO_REMOVALS if removed_elements is None else removed_elements,
+            line_number=None
         )
     
-    def _detect_sign_convention(self, text: str) -> int:
+    @staticmethod
+    def _build_sign_prefixes(indicators: Dict[str, int]) -> Dict[str, Tuple[int, int]]:
         """
-        Detect sign convention indicators in text.
+        Expand sign indicators into all accepted prefix spellings.
+        
+        Handles variations with parentheses and periods: "(cr)" also matches
+        "(cr.)", "cr." also matches "(cr)", and plain words match "(word)".
+        When several indicators share a spelling, the earliest one wins.
         
         Args:
-            text: Input text to analyze
+            indicators: Mapping of indicator to sign multiplier
             
         Returns:
-            1 for positive, -1 for negative
+            Mapping of prefix to (indicator order, multiplier)
         """
-        text_lower = text.lower().strip()
+        prefixes: Dict[str, Tuple[int, int]] = {}
         
-        # Check for explicit negative indicators at start
-        for indicator, multiplier in SIGN_CONVENTION_INDICATORS.items():
+        for order, (indicator, multiplier) in enumerate(indicators.items()):
             indicator_lower = indicator.lower()
-            # Check if text starts with this indicator exactly
-            if text_lower.startswith(indicator_lower):
-                return multiplier
-            
-            # Handle variations with parentheses and periods
-            # For indicators like "(cr)", also match "(cr.)" (period inside parens)
-            # For indicators like "cr.", also match "(cr)" and "(cr.)"
+            variants = [indicator_lower]
             if indicator_lower.startswith('(') and indicator_lower.endswith(')'):
-                # Indicator is already in parentheses, e.g., "(cr)"
-                # Also check for version with period inside: "(cr.)"
-                base = indicator_lower[1:-1]  # Remove parentheses: "cr"
-                # Check for (cr.) with period INSIDE the parentheses
-                if text_lower.startswith(f'({base}.)'):
-                    return multiplier
+                variants.append(f'({indicator_lower[1:-1]}.)')
             elif indicator_lower.endswith('.'):
-                # Indicator ends with period, e.g., "cr."
-                # Also check for version in parentheses: "(cr)" and "(cr.)"
-                base = indicator_lower.rstrip('.')  # Remove period: "cr"
-                if text_lower.startswith(f'({base})') or text_lower.startswith(f'({base}).'):
-                    return multiplier
+                variants.append(f"({indicator_lower.rstrip('.')})")
             else:
-                # Plain indicator, check for parenthesized version
-                if text_lower.startswith(f'({indicator_lower})') or text_lower.startswith(f'({indicator_lower}).'):
-                    return multiplier
-        
-        # Check for parenthetical numbers (typically negative)
-        if self.patterns['parenthetical_numbers'].search(text):
-            return -1
-        
-        return 1
-    
-    def _remove_note_references(self, text: str) -> Tuple[str, List[str]]:
-        """
-        Remove note and schedule references from text.
-        
-        Args:
-            text: Input text
+                variants.append(f'({indicator_lower})')
             
-        Returns:
-            Tuple of (cleaned_text, list_of_removed_references)
-        """
-        removed = []
-        
-        # Find all matches
-        matches = self.patterns['note_references'].findall(text)
-        
-        # Remove them
-        cleaned = self.patterns['note_references'].sub('', text)
-        
-        # Track what was removed
-        for match in matches:
-            match_clean = match.strip().lower()
-            if 'note' in match_clean:
-                removed.append(f'note_ref:{match}')
-            elif 'schedule' in match_clean:
-                removed.append(f'schedule_ref:{match}')
+            for variant in variants:
+                prefixes.setdefault(variant, (order, multiplier))
         
-        return cleaned, removed
+        return prefixes
     
-    def _clean_formatting(self, text: str) -> str:
+    def _detect_sign_convention(self, text: str, text_lower: Optional[str] = None) -> int:
         """
-        Clean formatting artifacts like dot leaders and excess whitespace.
-        Also converts to lowercase for better matching.
+        Detect sign convention indicators in text.
         
         Args:
-            text: Input text
+            text: Input text to analyze
+            text_lower: text.lower(), if the caller already computed it
             
         Returns:
-            Cleaned text in lowercase with normalized whitespace
+            1 for positive, -1 for negative
         """
-        # Convert to lowercase for consistent matching
-        text = text.lower()
-        
-        # Remove dot leaders (......)
-        text = self.patterns['dot_leaders'].sub(' ', text)
+        if text_lower is None:
+            text_lower = text.lower()
+        text_lower = text_lower.strip()
+        
+        # Check for explicit negative indicators at start: probe the prefix of
+        # each candidate length against the precomputed variant table
+        if text_lower[:1] in self._sign_first_chars:
+            best = None
+            for length in self._sign_prefix_lengths:
+                hit = self._sign_prefixes.get(text_lower[:length])
+                if hit is not None and (best is None or hit[0] < best[0]):
+                    best = hit
+            if best is not None:
+                return best[1]
         
-        # Normalize all whitespace (tabs, newlines, multiple spaces → single space)
-        text = self.patterns['excess_whitespace'].sub(' ', text)
-        
-        # Remove leading/trailing whitespace from each word
-        words = text.split()
-        text = ' '.join(words)
+        # Check for parenthetical numbers (typically negative)
+        if '(' in text and self.patterns['parenthetical_numbers'].search(text):
+            return -1
         
-        return text.strip()
+        return 1
     
-    def _convert_parenthetical_numbers(self, text: str) -> Tuple[str, List[str]]:
+    def _apply_cleanup_pass(
+        self,
+        text: str,
+        removed_elements: Optional[Dict[str, List[str]]],
+        text_lower: Optional[str] = None
+    ) -> str:
         """
-        Convert parenthetical numbers to negative signed format.
-        Example: (1,234) → -1234
+        Run the fused cleanup pattern over text in a single scan.
+        
+        Equivalent to removing note/schedule references, then dot leaders,
+        lowercasing and whitespace, then converting parenthetical numbers,
+        each as a separate pass.
         
         Args:
             text: Input text
+            removed_elements: Accumulator for removed notes and converted numbers,
+                or None to skip collecting them
+            text_lower: text.lower(), if the caller already computed it
             
         Returns:
-            Tuple of (converted_text, list_of_converted_numbers)
+            Cleaned text in lowercase with normalized whitespace
         """
-        converted = []
-        
-        def replace_parenthetical(match):
-            number = match.group(1)
-            converted.append(number)
-            # Remove commas and add negative sign
-            clean_number = number.replace(',', '')
-            return f'-{clean_number}'
-        
-        result = self.patterns['parenthetical_numbers'].sub(replace_parenthetical, text)
-        
-        return result, converted
+        track = removed_elements is not None
+        if track:
+            notes = removed_elements['notes']
+            numbers = removed_elements['numbers']
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # Every cleanup alternative needs '(', '...', 'note' or 'schedule'
+        if not ('(' in text or '...' in text or 'note' in text_lower or 'schedule' in text_lower):
+            return self.patterns['excess_whitespace'].sub(' ', text_lower).strip()
+        
+        # When lowercasing keeps every offset (always true for ASCII), scan the
+        # lowercase copy with the case-sensitive pattern and read the original
+        # spelling of removed references from the same span. Otherwise scan the
+        # original case-insensitively and lowercase afterwards.
+        aligned = len(text_lower) == len(text)
+        removed_note = False
+        numbers_start = len(numbers) if track else 0
+        
+        def dispatch(match):
+            nonlocal removed_note
+            kind = match.lastgroup
+            if kind == 'note':
+                removed_note = True
+                if not track:
+                    return ''
+                ref = text[match.start():match.end()] if aligned else match.group(0)
+                ref_lower = ref.strip().lower()
+                if 'note' in ref_lower:
+                    notes.append(sys.intern(f'note_ref:{ref}'))
+                elif 'schedule' in ref_lower:
+                    notes.append(sys.intern(f'schedule_ref:{ref}'))
+                return ''
+            return convert_number(match.group('paren'))
+        
+        def convert_number(number):
+            if track:
+                numbers.append(number)
+            return '-' + number.replace(',', '')
+        
+        if aligned:
+            text_lower = self._cleanup_pattern.sub(dispatch, text_lower)
+        else:
+            text_lower = self._cleanup_pattern_ci.sub(dispatch, text).lower()
+        
+        # Dots can meet once a reference is gone (e.g. "Revenue..(Note 12)...");
+        # the separate passes saw them as one leader
+        if removed_note or '...' in text_lower:
+            text_lower = self.patterns['dot_leaders'].sub(' ', text_lower)
+        
+        # Rarely, removing a reference also forms a new parenthetical number
+        # (e.g. "((Note 1)5)"). Redo those lines in pass order so the converted
+        # numbers are recorded in the same order as before.
+        parenthetical = self.patterns['parenthetical_numbers']
+        if removed_note and '(' in text_lower and parenthetical.search(text_lower):
+            if track:
+                del numbers[numbers_start:]
+            text_lower = self.patterns['note_references'].sub('', text).lower()
+            text_lower = self.patterns['dot_leaders'].sub(' ', text_lower)
+            text_lower = parenthetical.sub(lambda match: convert_number(match.group(1)), text_lower)
+        
+        return self.patterns['excess_whitespace'].sub(' ', text_lower).strip()
     
     def _expand_abbreviations_in_text(self, text: str) -> Tuple[str, List[str]]:
         """
@@ -277,11 +528,16 @@ class TextPreprocessor:
         
         for word in words:
             # Remove punctuation for lookup
-            clean_word = re.sub(r'[^\w]', '', word.lower())
+            # (most words are purely alphanumeric and need no substitution)
+            word_lower = word.lower()
+            if word_lower.isalnum():
+                clean_word = word_lower
+            else:
+                clean_word = _NON_WORD_RE.sub('', word_lower)
             
             # Check if it's an abbreviation
-            expanded = expand_abbreviations(clean_word)
-            if expanded != clean_word:
+            expanded = _ABBREVIATION_EXPANSIONS.get(clean_word)
+            if expanded is not None:
                 detected.append(clean_word)
                 expanded_words.append(expanded)
             else:
@@ -292,40 +548,32 @@ class TextPreprocessor:
     def _create_canonical_form(self, text: str) -> str:
         """
         Create canonical form for matching:
-        - Lowercase
-        - Unicode normalization
+        - Unicode normalization (lowercased again only if it changed the text)
         - Separator standardization
         - Remove non-alphanumeric except spaces
         
         Args:
-            text: Input text
+            text: Lowercased input text (preprocess() lowercases during cleanup)
             
         Returns:
             Canonical form text
         """
-        # Unicode normalization (NFKD to decompose characters)
-        text = unicodedata.normalize('NFKD', text)
-        
-        # Convert to lowercase
-        text = text.lower()
-        
-        # Replace smart quotes and special characters
-        # Note: We preserve dashes here because they might be part of dates (YYYY-MM-DD)
-        # The dash-to-space conversion happens after date normalization
-        replacements = {
-            ''': "'", ''': "'", '"': '"', '"': '"',
-            '–': ' ', '—': ' ', '−': ' ',
-            ' ': ' ', ' ': ' ', '\xa0': ' ',
-            '&': ' and ',
-            '/': ' ',
-            '_': ' '
-        }
-        
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        
-        # Remove remaining non-alphanumeric except spaces, dashes (for dates), and periods (for decimals)
-        text = re.sub(r'[^\w\s.\-]', '', text)
+        # Unicode normalization (NFKD to decompose characters).
+        # Pure-ASCII text is already in NFKD form, so skip the call for it.
+        # Decomposition can yield uppercase (e.g. '℃' -> '°C'), so lowercase again then.
+        is_ascii = text.isascii()
+        if not is_ascii:
+            text = unicodedata.normalize('NFKD', text).lower()
+        
+        # Replace smart quotes and special characters, then remove remaining
+        # non-alphanumeric except spaces, dashes (for dates), and periods (for decimals).
+        # Note: We preserve ASCII dashes here because they might be part of dates (YYYY-MM-DD)
+        # ASCII lines do the replacement and the removal in one translate() pass.
+        if is_ascii:
+            text = text.translate(_ASCII_CANONICAL_TABLE)
+        else:
+            text = text.translate(_CANONICAL_REPLACEMENTS)
+            text = _CANONICAL_FILTER_RE.sub('', text)
         
         # Normalize multiple spaces
         text = self.patterns['excess_whitespace'].sub(' ', text)
@@ -344,6 +592,10 @@ class TextPreprocessor:
         """
         normalized_dates = []
         
+        # Dates need at least one '.', '-' or '/' separator
+        if '.' not in text and '-' not in text and '/' not in text:
+            return text, normalized_dates
+        
         def replace_date(match):
             day, month, year = match.groups()
             
@@ -355,48 +607,42 @@ class TextPreprocessor:
                 else:
                     year = '20' + year
             
-            try:
-                date_obj = datetime(int(year), int(month), int(day))
-                iso_date = date_obj.strftime('%Y-%m-%d')
-                normalized_dates.append(iso_date)
-                return iso_date
-            except ValueError:
+            iso_date = _format_iso_date(int(year), int(month), int(day))
+            if iso_date is None:
                 return match.group(0)
+            normalized_dates.append(iso_date)
+            return iso_date
         
         result = self.patterns['date_formats'].sub(replace_date, text)
         
         return result, normalized_dates
     
-    def _normalize_numbers(self, text: str) -> str:
+    def _join_digit_groups(match) -> str:
         """
-        Normalize number formats by removing thousand separators.
-        Handles both standard (1,000,000) and Indian (1,00,000) formats.
-        Preserves decimal points.
+        Drop thousand separators inside one run of comma-separated digit groups.
+        
+        A comma is a separator when a digit precedes it and at least three
+        digits follow once separators to its right are dropped, so the run is
+        resolved right to left in one pass (1,00,000 -> 100000, 1,23,4 kept).
         
         Args:
-            text: Input text
+            match: Match over a run like "1,00,000"
             
         Returns:
-            Text with normalized numbers
+            The run with separator commas removed
         """
-        # First, protect decimal points by temporarily replacing them
-        text = re.sub(r'(\d)\.(\d)', r'\1<DECIMAL>\2', text)
-        
-        # Remove thousand separators (commas between digits)
-        # This handles both standard and Indian formats
-        def replace_separator(match):
-            return match.group(1) + match.group(2)
-        
-        # Keep doing it until no more changes (handles Indian format 1,00,000)
-        prev_text = None
-        while prev_text != text:
-            prev_text = text
-            text = self.patterns['thousand_separators'].sub(replace_separator, text)
-        
-        # Restore decimal points
-        text = text.replace('<DECIMAL>', '.')
-        
-        return text
+        groups = match.group(0).split(',')
+        out = [groups[-1]]
+        trailing_digits = len(groups[-1])
+        
+        for group in reversed(groups[:-1]):
+            if not (group and trailing_digits >= 3):
+                out.append(',')
+                trailing_digits = 0
+            out.append(group)
+            trailing_digits += len(group)
+        
+        return ''.join(reversed(out))
     
     def _apply_sign_to_numbers(self, text: str) -> str:
         """
@@ -408,17 +654,10 @@ class TextPreprocessor:
         Returns:
             Text with negative sign applied to numbers
         """
-        # Find positive numbers and add negative sign
-        # Match numbers that don't already have a sign
-        def add_negative_sign(match):
-            number = match.group(1)
-            # Don't add sign if already negative
-            if number.startswith('-'):
-                return match.group(0)
-            return f'-{number}'
-        
-        # Apply to standalone numbers (preceded by space or start of string)
-        result = re.sub(r'(?<=\s)(\d+(?:\.\d+)?)', add_negative_sign, text)
+        # Insert '-' before every number that starts after whitespace. The
+        # zero-width pattern inserts in C with no per-number Python callback;
+        # a whitespace-preceded digit can never already carry a sign.
+        result = self.patterns['unsigned_number_starts'].sub('-', text)
         # Also apply to numbers at the start
         if result and result[0].isdigit():
             result = '-' + result
@@ -428,7 +667,8 @@ class TextPreprocessor:
     def preprocess_batch(
         self, 
         texts: List[str], 
-        line_numbers: Optional[List[int]] = None
+        line_numbers: Optional[List[int]] = None,
+        max_workers: Optional[int] = None
     ) -> List[PreprocessingResult]:
         """
         Preprocess multiple text lines in batch.
@@ -436,20 +676,108 @@ class TextPreprocessor:
         Args:
             texts: List of text lines
             line_numbers: Optional list of line numbers
+            max_workers: Worker processes to use for large batches (serial if None or 1)
             
         Returns:
             List of PreprocessingResult objects
         """
-        results = []
+        numbered = len(line_numbers) if line_numbers else 0
+        
+        if max_workers and max_workers > 1 and len(texts) >= PARALLEL_BATCH_THRESHOLD:
+            resolved = [line_numbers[i] if i < numbered else i + 1 for i in range(len(texts))]
+            return self._preprocess_batch_parallel(texts, resolved, max_workers)
+        
+        return list(self.iter_preprocess(texts, line_numbers))
+    
+    def iter_preprocess(
+        self,
+        texts: Iterable[str],
+        line_numbers: Optional[List[int]] = None
+    ) -> Iterator[PreprocessingResult]:
+        """
+        Lazily preprocess text lines, yielding one result at a time.
+        
+        Lets callers stream a document through matching in constant memory
+        instead of materializing every result first.
+        
+        Args:
+            texts: Iterable of text lines
+            line_numbers: Optional list of line numbers
+            
+        Yields:
+            PreprocessingResult for each line, in input order
+        """
+        preprocess = self.preprocess
+        numbered = len(line_numbers) if line_numbers else 0
         
         for i, text in enumerate(texts):
-            line_num = line_numbers[i] if line_numbers and i < len(line_numbers) else i + 1
-            result = self.preprocess(text, line_num)
-            results.append(result)
+            yield preprocess(text, line_numbers[i] if i < numbered else i + 1)
+    
+    def _preprocess_batch_parallel(
+        self,
+        texts: List[str],
+        line_numbers: List[int],
+        max_workers: int
+    ) -> List[PreprocessingResult]:
+        """
+        Preprocess a large batch across worker processes.
+        
+        Lines are independent, so the batch is split into fixed-size chunks and
+        each worker builds its own TextPreprocessor once. Result order is preserved.
+        """
+        chunks = [
+            (texts[start:start + BATCH_CHUNK_SIZE], line_numbers[start:start + BATCH_CHUNK_SIZE])
+            for start in range(0, len(texts), BATCH_CHUNK_SIZE)
+        ]
+        
+        results: List[PreprocessingResult] = []
+        with mp.Pool(
+            processes=min(max_workers, len(chunks)),
+            initializer=_init_batch_worker,
+            initargs=(self.config,)
+        ) as pool:
+            for chunk_results in pool.imap(_preprocess_chunk, chunks):
+                results.extend(chunk_results)
         
         return results
 
 
+# Parallel batch preprocessing: batches below the threshold stay in-process,
+# where pool startup would cost more than it saves
+PARALLEL_BATCH_THRESHOLD = 5000
+BATCH_CHUNK_SIZE = 1000
+
+# Worker-process preprocessor, created once per worker by _init_batch_worker
+_worker_preprocessor: Optional[TextPreprocessor] = None
+
+
+def _init_batch_worker(config: Optional[Dict]) -> None:
+    """Pool initializer: build this worker's TextPreprocessor."""
+    global _worker_preprocessor
+    _worker_preprocessor = TextPreprocessor(config)
+
+
+def _preprocess_chunk(chunk: Tuple[List[str], List[int]]) -> List[PreprocessingResult]:
+    """Pool task: preprocess one chunk of (texts, line_numbers)."""
+    texts, line_numbers = chunk
+    preprocess = _worker_preprocessor.preprocess
+    return [preprocess(text, line_num) for text, line_num in zip(texts, line_numbers)]
+
+
+# Per-thread default preprocessor: reusing it avoids recompiling every
+# pattern on each convenience call and keeps its line cache warm
+_thread_local = threading.local()
+
+
+def _get_default_preprocessor() -> TextPreprocessor:
+    """Return this thread's shared default TextPreprocessor."""
+    preprocessor = getattr(_thread_local, 'preprocessor', None)
+    if preprocessor is None:
+        preprocessor = TextPreprocessor()
+        _thread_local.preprocessor = preprocessor
+    return preprocessor
+
+
 # Convenience function for quick preprocessing
 def preprocess_text(text: str, line_number: Optional[int] = None) -> PreprocessingResult:
     """
@@ -462,5 +790,4 @@ def preprocess_text(text: str, line_number: Optional[int] = None) -> Preprocessi
     Returns:
         PreprocessingResult
     """
-    preprocessor = TextPreprocessor()
-    return preprocessor.preprocess(text, line_number)
+    return _get_default_preprocessor().preprocess(text, line_number)
@@ -4,26 +4,73 @@ Progress callback module for streaming partial results during parsing.
 
 import sys
 import json
-from typing import Optional, Callable, Any, List
+import time
+from contextvars import ContextVar
+from typing import Optional, Callable, Any, List, Dict
 
-# Global callback for progress updates
-_progress_callback: Optional[Callable] = None
+# Optional fast JSON encoder for the stdout progress stream
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Callback for progress updates, scoped to the current context so concurrent
+# pipelines (threads, asyncio tasks) each report to their own callback
+_progress_callback: ContextVar[Optional[Callable]] = ContextVar('_progress_callback', default=None)
+
+# Plain page updates closer together than this are dropped; the final page and
+# updates carrying partial results are always sent
+MIN_PROGRESS_INTERVAL = 0.05
+
+# Time of the last update sent, kept per context like the callback so
+# concurrent pipelines never throttle each other
+_last_emit_time: ContextVar[float] = ContextVar('_last_emit_time', default=0.0)
 
 def set_progress_callback(callback: Optional[Callable]):
-    """Set the global progress callback for streaming results."""
-    global _progress_callback
-    _progress_callback = callback
+    """
+    Set the progress callback for streaming results in the current context.
+
+    New threads start from an empty context; run them under
+    contextvars.copy_context().run to inherit the caller's callback.
+    """
+    _progress_callback.set(callback)
+
+def _emit_json_line(data: Dict[str, Any]):
+    """Write one JSON object per line to stdout for the Rust bridge."""
+    buffer = getattr(sys.stdout, 'buffer', None)
+    if not ORJSON_AVAILABLE or buffer is None:
+        print(json.dumps(data))
+        sys.stdout.flush()
+        return
+
+    try:
+        payload = orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE)
+    except TypeError:
+        # Types orjson rejects (e.g. ints beyond 64 bits)
+        payload = json.dumps(data).encode('utf-8') + b'\n'
+
+    # Flush pending text output first so lines keep their order
+    sys.stdout.flush()
+    buffer.write(payload)
+    buffer.flush()
 
 def send_progress(current_page: int, total_pages: int, status_message: str = "",
                 partial_items: Optional[List[Any]] = None,
                 partial_text: Optional[str] = None):
     """Send progress update with optional partial data."""
-    global _progress_callback
+    now = time.monotonic()
+    if (current_page != total_pages and partial_items is None and partial_text is None
+            and now - _last_emit_time.get() < MIN_PROGRESS_INTERVAL):
+        return
+    _last_emit_time.set(now)
 
     # Call callback if set
-    if _progress_callback:
+    callback = _progress_callback.get()
+    if callback:
         try:
-            _progress_callback(total_pages, current_page, status_message, partial_items, partial_text)
+            callback(total_pages, current_page, status_message, partial_items, partial_text)
         except Exception as e:
             print(f"[Progress] Callback error: {e}", file=sys.stderr)
 
@@ -42,10 +89,8 @@ def send_progress(current_page: int, total_pages: int, status_message: str = "",
     if partial_text is not None:
         progress_data['partialText'] = partial_text
 
-    print(json.dumps(progress_data))
-    sys.stdout.flush()
+    _emit_json_line(progress_data)
 
 def clear_callback():
     """Clear the progress callback."""
-    global _progress_callback
-    _progress_callback = None
+    _progress_callback.set(None)
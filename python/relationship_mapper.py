@@ -4,8 +4,407 @@ Financial Term Matching System - Synonym Networks & Relationships
 Comprehensive synonym networks, parent-child hierarchies, and cross-standard mappings.
 """
 
-from typing import Dict, List, Set, Optional, Tuple
-from collections import defaultdict
+from typing import Any, Dict, List, Mapping, Sequence, Set, Optional, Tuple
+from collections import deque
+from types import MappingProxyType
+
+
+class _SynonymTrie:
+    """Character trie over synonym keys for exact and edit-bounded lookup."""
+    
+    __slots__ = ('_root', '_size')
+    
+    # Node key holding (insertion order, value) at the end of a word
+    _END = None
+    
+    def __init__(self):
+        self._root: Dict = {}
+        self._size = 0
+    
+    def insert(self, key: str, value: str):
+        """Store value under key."""
+        node = self._root
+        for char in key:
+            node = node.setdefault(char, {})
+        if self._END not in node:
+            node[self._END] = (self._size, value)
+            self._size += 1
+        else:
+            node[self._END] = (node[self._END][0], value)
+    
+    def match_token(self, token: str, max_edits: int = 0) -> Optional[str]:
+        """
+        Find the value of the key closest to token.
+        
+        Args:
+            token: Token to look up
+            max_edits: Maximum Levenshtein distance allowed (0 = exact match)
+            
+        Returns:
+            Value of the nearest key within max_edits, or None. Ties go to
+            the key inserted first.
+        """
+        if max_edits <= 0:
+            node = self._root
+            for char in token:
+                node = node.get(char)
+                if node is None:
+                    return None
+            entry = node.get(self._END)
+            return entry[1] if entry else None
+        
+        # Walk the trie carrying one row of the edit-distance table per node,
+        # pruning subtrees that can no longer beat the best match so far
+        best = [max_edits, self._size, None]
+        first_row = list(range(len(token) + 1))
+        for char, child in self._root.items():
+            if char is not self._END:
+                self._search(child, char, token, first_row, best)
+        return best[2]
+    
+    def _search(self, node: Dict, char: str, token: str, prev_row: List[int], best: List):
+        row = [prev_row[0] + 1]
+        for i, token_char in enumerate(token, 1):
+            row.append(min(
+                row[i - 1] + 1,
+                prev_row[i] + 1,
+                prev_row[i - 1] + (token_char != char)
+            ))
+        
+        entry = node.get(self._END)
+        if entry is not None and (row[-1], entry[0]) < (best[0], best[1]):
+            best[0], best[1], best[2] = row[-1], entry[0], entry[1]
+        
+        if min(row) <= best[0]:
+            for next_char, child in node.items():
+                if next_char is not self._END:
+                    self._search(child, next_char, token, row, best)
+
+
+def _freeze(value: Any) -> Any:
+    """Deep read-only copy of a table: dicts become mapping proxies, lists tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Synonym networks - terms that mean the same thing
+_SYNONYM_NETWORKS = _freeze({
+    'trade_receivables': {
+        'synonyms': [
+            'accounts_receivable',
+            'sundry_debtors',
+            'trade_debtors',
+            'receivables_from_customers',
+            'amounts_due_from_customers'
+        ],
+        'category': 'Balance Sheet - Assets'
+    },
+    'trade_payables': {
+        'synonyms': [
+            'accounts_payable',
+            'sundry_creditors',
+            'trade_creditors',
+            'payables_to_suppliers',
+            'amounts_due_to_suppliers'
+        ],
+        'category': 'Balance Sheet - Liabilities'
+    },
+    'inventory': {
+        'synonyms': [
+            'stock',
+            'stock_in_trade',
+            'merchandise',
+            'goods',
+            'raw_materials',
+            'work_in_progress',
+            'finished_goods'
+        ],
+        'category': 'Balance Sheet - Assets'
+    },
+    'property_plant_equipment': {
+        'synonyms': [
+            'ppe',
+            'fixed_assets',
+            'tangible_assets',
+            'plant_property_equipment',
+            'land_buildings_equipment'
+        ],
+        'category': 'Balance Sheet - Assets'
+    },
+    'revenue': {
+        'synonyms': [
+            'sales',
+            'turnover',
+            'gross_revenue',
+            'total_revenue',
+            'revenue_from_operations',
+            'operating_revenue'
+        ],
+        'category': 'Income Statement'
+    },
+    'profit': {
+        'synonyms': [
+            'earnings',
+            'income',
+            'gain',
+            'surplus',
+            'net_profit',
+            'profit_for_the_year',
+            'profit_after_tax'
+        ],
+        'category': 'Income Statement'
+    },
+    'borrowings': {
+        'synonyms': [
+            'loans',
+            'debt',
+            'credit_facilities',
+            'financing',
+            'indebtedness'
+        ],
+        'category': 'Balance Sheet - Liabilities'
+    },
+    'equity': {
+        'synonyms': [
+            'shareholders_funds',
+            'net_worth',
+            'owners_equity',
+            'shareholders_equity',
+            'capital_and_reserves'
+        ],
+        'category': 'Balance Sheet - Equity'
+    },
+    'depreciation': {
+        'synonyms': [
+            'amortization',
+            'amortisation',
+            'depletion',
+            'write_down',
+            'impairment'
+        ],
+        'category': 'Income Statement'
+    },
+    'cash': {
+        'synonyms': [
+            'cash_and_cash_equivalents',
+            'cash_and_bank_balances',
+            'liquid_assets',
+            'cash_on_hand'
+        ],
+        'category': 'Balance Sheet - Assets'
+    },
+})
+
+# Parent-child hierarchies
+_PARENT_CHILD_HIERARCHIES = _freeze({
+    'total_assets': {
+        'children': [
+            'total_non_current_assets',
+            'total_current_assets',
+            'assets_held_for_sale'
+        ],
+        'category': 'Balance Sheet - Assets'
+    },
+    'total_non_current_assets': {
+        'children': [
+            'property_plant_equipment',
+            'capital_work_in_progress',
+            'intangible_assets',
+            'goodwill',
+            'investment_property',
+            'right_of_use_assets',
+            'financial_assets_non_current',
+            'deferred_tax_assets'
+        ],
+        'category': 'Balance Sheet - Assets'
+    },
+    'total_current_assets': {
+        'children': [
+            'inventories',
+            'trade_receivables',
+            'cash_and_equivalents',
+            'short_term_investments',
+            'other_current_assets'
+        ],
+        'category': 'Balance Sheet - Assets'
+    },
+    'property_plant_equipment': {
+        'children': [
+            'land_and_buildings',
+            'plant_and_machinery',
+            'furniture_and_fixtures',
+            'vehicles',
+            'office_equipment',
+            'capital_work_in_progress'
+        ],
+        'category': 'Balance Sheet - Assets'
+    },
+    'intangible_assets': {
+        'children': [
+            'goodwill',
+            'software',
+            'patents',
+            'trademarks',
+            'copyrights',
+            'licenses',
+            'customer_relationships'
+        ],
+        'category': 'Balance Sheet - Assets'
+    },
+    'total_liabilities': {
+        'children': [
+            'total_non_current_liabilities',
+            'total_current_liabilities'
+        ],
+        'category': 'Balance Sheet - Liabilities'
+    },
+    'total_non_current_liabilities': {
+        'children': [
+            'long_term_borrowings',
+            'deferred_tax_liabilities',
+            'long_term_provisions',
+            'other_non_current_liabilities'
+        ],
+        'category': 'Balance Sheet - Liabilities'
+    },
+    'total_current_liabilities': {
+        'children': [
+            'short_term_borrowings',
+            'trade_payables',
+            'short_term_provisions',
+            'other_current_liabilities'
+        ],
+        'category': 'Balance Sheet - Liabilities'
+    },
+    'total_equity': {
+        'children': [
+            'share_capital',
+            'reserves_and_surplus',
+            'retained_earnings',
+            'other_comprehensive_income',
+            'non_controlling_interest'
+        ],
+        'category': 'Balance Sheet - Equity'
+    },
+    'reserves_and_surplus': {
+        'children': [
+            'capital_reserve',
+            'securities_premium',
+            'general_reserve',
+            'retained_earnings',
+            'statutory_reserve'
+        ],
+        'category': 'Balance Sheet - Equity'
+    },
+    'total_revenue': {
+        'children': [
+            'revenue_from_operations',
+            'other_income'
+        ],
+        'category': 'Income Statement'
+    },
+    'total_expenses': {
+        'children': [
+            'cost_of_materials_consumed',
+            'purchases_of_stock_in_trade',
+            'changes_in_inventories',
+            'employee_benefits_expense',
+            'finance_costs',
+            'depreciation_and_amortization',
+            'other_expenses'
+        ],
+        'category': 'Income Statement'
+    },
+})
+
+# Cross-standard mappings (IndAS, GAAP, IFRS)
+_CROSS_STANDARD_MAPPINGS = _freeze({
+    # Revenue recognition
+    'IndAS 115': {
+        'gaap': ['ASC 606'],
+        'ifrs': ['IFRS 15'],
+        'terms': [
+            'contract_assets',
+            'contract_liabilities',
+            'performance_obligations',
+            'transaction_price'
+        ]
+    },
+    # Leases
+    'IndAS 116': {
+        'gaap': ['ASC 842'],
+        'ifrs': ['IFRS 16'],
+        'terms': [
+            'right_of_use_assets',
+            'lease_liabilities',
+            'rou_assets'
+        ]
+    },
+    # Financial instruments
+    'IndAS 109': {
+        'gaap': ['ASC 320', 'ASC 325', 'ASC 815'],
+        'ifrs': ['IFRS 9'],
+        'terms': [
+            'financial_assets_fvtpl',
+            'financial_assets_fvtoci',
+            'financial_assets_amortized_cost',
+            'expected_credit_loss'
+        ]
+    },
+    # Revenue (old)
+    'IndAS 18': {
+        'gaap': ['ASC 605'],
+        'ifrs': ['IAS 18'],
+        'terms': [
+            'revenue_from_sale_of_goods',
+            'revenue_from_rendering_of_services'
+        ]
+    },
+    # PPE
+    'IndAS 16': {
+        'gaap': ['ASC 360'],
+        'ifrs': ['IAS 16'],
+        'terms': [
+            'property_plant_equipment',
+            'depreciation',
+            'useful_life',
+            'residual_value'
+        ]
+    },
+    # Intangibles
+    'IndAS 38': {
+        'gaap': ['ASC 350'],
+        'ifrs': ['IAS 38'],
+        'terms': [
+            'intangible_assets',
+            'amortization',
+            'research_and_development'
+        ]
+    },
+    # Business combinations
+    'IndAS 103': {
+        'gaap': ['ASC 805'],
+        'ifrs': ['IFRS 3'],
+        'terms': [
+            'goodwill',
+            'purchase_consideration',
+            'fair_value_adjustments'
+        ]
+    },
+    # Consolidation
+    'IndAS 110': {
+        'gaap': ['ASC 810'],
+        'ifrs': ['IFRS 10'],
+        'terms': [
+            'non_controlling_interest',
+            'control',
+            'subsidiary'
+        ]
+    },
+})
 
 
 class RelationshipMapper:
@@ -16,322 +415,21 @@ class RelationshipMapper:
     - Cross-standard mappings
     """
     
+    __slots__ = (
+        'synonym_networks', 'parent_child_hierarchies', 'cross_standard_mappings',
+        'synonym_to_canonical', '_synonym_trie', '_synonyms_for',
+        'child_to_parent', '_ancestors', 'term_to_standards', '_term_to_mappings',
+        '_standard_names', '_standard_bitmask',
+        '_neighbors', '_total_parents', '_total_synonyms', '_total_children',
+        '_max_depth', '_total_gaap', '_total_ifrs'
+    )
+    
     def __init__(self):
-        # Synonym networks - terms that mean the same thing
-        self.synonym_networks = {
-            'trade_receivables': {
-                'synonyms': [
-                    'accounts_receivable',
-                    'sundry_debtors',
-                    'trade_debtors',
-                    'receivables_from_customers',
-                    'amounts_due_from_customers'
-                ],
-                'category': 'Balance Sheet - Assets'
-            },
-            'trade_payables': {
-                'synonyms': [
-                    'accounts_payable',
-                    'sundry_creditors',
-                    'trade_creditors',
-                    'payables_to_suppliers',
-                    'amounts_due_to_suppliers'
-                ],
-                'category': 'Balance Sheet - Liabilities'
-            },
-            'inventory': {
-                'synonyms': [
-                    'stock',
-                    'stock_in_trade',
-                    'merchandise',
-                    'goods',
-                    'raw_materials',
-                    'work_in_progress',
-                    'finished_goods'
-                ],
-                'category': 'Balance Sheet - Assets'
-            },
-            'property_plant_equipment': {
-                'synonyms': [
-                    'ppe',
-                    'fixed_assets',
-                    'tangible_assets',
-                    'plant_property_equipment',
-                    'land_buildings_equipment'
-                ],
-                'category': 'Balance Sheet - Assets'
-            },
-            'revenue': {
-                'synonyms': [
-                    'sales',
-                    'turnover',
-                    'gross_revenue',
-                    'total_revenue',
-                    'revenue_from_operations',
-                    'operating_revenue'
-                ],
-                'category': 'Income Statement'
-            },
-            'profit': {
-                'synonyms': [
-                    'earnings',
-                    'income',
-                    'gain',
-                    'surplus',
-                    'net_profit',
-                    'profit_for_the_year',
-                    'profit_after_tax'
-                ],
-                'category': 'Income Statement'
-            },
-            'borrowings': {
-                'synonyms': [
-                    'loans',
-                    'debt',
-                    'credit_facilities',
-                    'financing',
-                    'indebtedness'
-                ],
-                'category': 'Balance Sheet - Liabilities'
-            },
-            'equity': {
-                'synonyms': [
-                    'shareholders_funds',
-                    'net_worth',
-                    'owners_equity',
-                    'shareholders_equity',
-                    'capital_and_reserves'
-                ],
-                'category': 'Balance Sheet - Equity'
-            },
-            'depreciation': {
-                'synonyms': [
-                    'amortization',
-                    'amortisation',
-                    'depletion',
-                    'write_down',
-                    'impairment'
-                ],
-                'category': 'Income Statement'
-            },
-            'cash': {
-                'synonyms': [
-                    'cash_and_cash_equivalents',
-                    'cash_and_bank_balances',
-                    'liquid_assets',
-                    'cash_on_hand'
-                ],
-                'category': 'Balance Sheet - Assets'
-            },
-        }
-        
-        # Parent-child hierarchies
-        self.parent_child_hierarchies = {
-            'total_assets': {
-                'children': [
-                    'total_non_current_assets',
-                    'total_current_assets',
-                    'assets_held_for_sale'
-                ],
-                'category': 'Balance Sheet - Assets'
-            },
-            'total_non_current_assets': {
-                'children': [
-                    'property_plant_equipment',
-                    'capital_work_in_progress',
-                    'intangible_assets',
-                    'goodwill',
-                    'investment_property',
-                    'right_of_use_assets',
-                    'financial_assets_non_current',
-                    'deferred_tax_assets'
-                ],
-                'category': 'Balance Sheet - Assets'
-            },
-            'total_current_assets': {
-                'children': [
-                    'inventories',
-                    'trade_receivables',
-                    'cash_and_equivalents',
-                    'short_term_investments',
-                    'other_current_assets'
-                ],
-                'category': 'Balance Sheet - Assets'
-            },
-            'property_plant_equipment': {
-                'children': [
-                    'land_and_buildings',
-                    'plant_and_machinery',
-                    'furniture_and_fixtures',
-                    'vehicles',
-                    'office_equipment',
-                    'capital_work_in_progress'
-                ],
-                'category': 'Balance Sheet - Assets'
-            },
-            'intangible_assets': {
-                'children': [
-                    'goodwill',
-                    'software',
-                    'patents',
-                    'trademarks',
-                    'copyrights',
-                    'licenses',
-                    'customer_relationships'
-                ],
-                'category': 'Balance Sheet - Assets'
-            },
-            'total_liabilities': {
-                'children': [
-                    'total_non_current_liabilities',
-                    'total_current_liabilities'
-                ],
-                'category': 'Balance Sheet - Liabilities'
-            },
-            'total_non_current_liabilities': {
-                'children': [
-                    'long_term_borrowings',
-                    'deferred_tax_liabilities',
-                    'long_term_provisions',
-                    'other_non_current_liabilities'
-                ],
-                'category': 'Balance Sheet - Liabilities'
-            },
-            'total_current_liabilities': {
-                'children': [
-                    'short_term_borrowings',
-                    'trade_payables',
-                    'short_term_provisions',
-                    'other_current_liabilities'
-                ],
-                'category': 'Balance Sheet - Liabilities'
-            },
-            'total_equity': {
-                'children': [
-                    'share_capital',
-                    'reserves_and_surplus',
-                    'retained_earnings',
-                    'other_comprehensive_income',
-                    'non_controlling_interest'
-                ],
-                'category': 'Balance Sheet - Equity'
-            },
-            'reserves_and_surplus': {
-                'children': [
-                    'capital_reserve',
-                    'securities_premium',
-                    'general_reserve',
-                    'retained_earnings',
-                    'statutory_reserve'
-                ],
-                'category': 'Balance Sheet - Equity'
-            },
-            'total_revenue': {
-                'children': [
-                    'revenue_from_operations',
-                    'other_income'
-                ],
-                'category': 'Income Statement'
-            },
-            'total_expenses': {
-                'children': [
-                    'cost_of_materials_consumed',
-                    'purchases_of_stock_in_trade',
-                    'changes_in_inventories',
-                    'employee_benefits_expense',
-                    'finance_costs',
-                    'depreciation_and_amortization',
-                    'other_expenses'
-                ],
-                'category': 'Income Statement'
-            },
-        }
-        
-        # Cross-standard mappings (IndAS, GAAP, IFRS)
-        self.cross_standard_mappings = {
-            # Revenue recognition
-            'IndAS 115': {
-                'gaap': ['ASC 606'],
-                'ifrs': ['IFRS 15'],
-                'terms': [
-                    'contract_assets',
-                    'contract_liabilities',
-                    'performance_obligations',
-                    'transaction_price'
-                ]
-            },
-            # Leases
-            'IndAS 116': {
-                'gaap': ['ASC 842'],
-                'ifrs': ['IFRS 16'],
-                'terms': [
-                    'right_of_use_assets',
-                    'lease_liabilities',
-                    'rou_assets'
-                ]
-            },
-            # Financial instruments
-            'IndAS 109': {
-                'gaap': ['ASC 320', 'ASC 325', 'ASC 815'],
-                'ifrs': ['IFRS 9'],
-                'terms': [
-                    'financial_assets_fvtpl',
-                    'financial_assets_fvtoci',
-                    'financial_assets_amortized_cost',
-                    'expected_credit_loss'
-                ]
-            },
-            # Revenue (old)
-            'IndAS 18': {
-                'gaap': ['ASC 605'],
-                'ifrs': ['IAS 18'],
-                'terms': [
-                    'revenue_from_sale_of_goods',
-                    'revenue_from_rendering_of_services'
-                ]
-            },
-            # PPE
-            'IndAS 16': {
-                'gaap': ['ASC 360'],
-                'ifrs': ['IAS 16'],
-                'terms': [
-                    'property_plant_equipment',
-                    'depreciation',
-                    'useful_life',
-                    'residual_value'
-                ]
-            },
-            # Intangibles
-            'IndAS 38': {
-                'gaap': ['ASC 350'],
-                'ifrs': ['IAS 38'],
-                'terms': [
-                    'intangible_assets',
-                    'amortization',
-                    'research_and_development'
-                ]
-            },
-            # Business combinations
-            'IndAS 103': {
-                'gaap': ['ASC 805'],
-                'ifrs': ['IFRS 3'],
-                'terms': [
-                    'goodwill',
-                    'purchase_consideration',
-                    'fair_value_adjustments'
-                ]
-            },
-            # Consolidation
-            'IndAS 110': {
-                'gaap': ['ASC 810'],
-                'ifrs': ['IFRS 10'],
-                'terms': [
-                    'non_controlling_interest',
-                    'control',
-                    'subsidiary'
-                ]
-            },
-        }
+        # Tables are shared by every instance and frozen all the way down;
+        # getters hand out fresh lists
+        self.synonym_networks = _SYNONYM_NETWORKS
+        self.parent_child_hierarchies = _PARENT_CHILD_HIERARCHIES
+        self.cross_standard_mappings = _CROSS_STANDARD_MAPPINGS
         
         # Build reverse lookup maps
         self._build_reverse_maps()
@@ -344,21 +442,95 @@ class RelationshipMapper:
             for synonym in data['synonyms']:
                 self.synonym_to_canonical[synonym] = canonical
         
+        # Trie over synonym keys for approximate get_canonical_term lookups
+        self._synonym_trie = _SynonymTrie()
+        for synonym, canonical in self.synonym_to_canonical.items():
+            self._synonym_trie.insert(synonym, canonical)
+        
+        # Synonym list for every canonical term and every synonym, so
+        # get_synonyms is one lookup (canonical entries take precedence)
+        self._synonyms_for: Dict[str, Tuple[str, ...]] = {
+            synonym: self.synonym_networks[canonical]['synonyms']
+            for synonym, canonical in self.synonym_to_canonical.items()
+        }
+        for canonical, data in self.synonym_networks.items():
+            self._synonyms_for[canonical] = data['synonyms']
+        
         # Reverse parent-child map
         self.child_to_parent = {}
         for parent, data in self.parent_child_hierarchies.items():
             for child in data['children']:
                 self.child_to_parent[child] = parent
         
-        # Term to standard map
-        self.term_to_standards = defaultdict(list)
+        # Ancestor chain (immediate parent to root) for every child term;
+        # the hierarchy is fixed after __init__, so build the chains here.
+        # A term's chain is its parent plus the parent's chain, so each
+        # chain is derived from one already built instead of re-walked.
+        self._ancestors: Dict[str, Tuple[str, ...]] = {}
+        for child in self.child_to_parent:
+            pending = []
+            current = child
+            while current in self.child_to_parent and current not in self._ancestors:
+                pending.append(current)
+                current = self.child_to_parent[current]
+            chain = self._ancestors.get(current, ())
+            for term in reversed(pending):
+                chain = (self.child_to_parent[term],) + chain
+                self._ancestors[term] = chain
+        
+        # Term to standard map (one shared, read-only record per standard)
+        self.term_to_standards: Dict[str, List[Mapping[str, Any]]] = {}
         for indas_std, data in self.cross_standard_mappings.items():
+            record = MappingProxyType({
+                'indas': indas_std,
+                'gaap': data['gaap'],
+                'ifrs': data['ifrs']
+            })
             for term in data['terms']:
-                self.term_to_standards[term].append({
-                    'indas': indas_std,
-                    'gaap': data['gaap'],
-                    'ifrs': data['ifrs']
-                })
+                self.term_to_standards.setdefault(term, []).append(record)
+        
+        # Bitmask of applicable standards per term; bit i is the i-th IndAS standard
+        self._standard_names: Tuple[str, ...] = tuple(self.cross_standard_mappings)
+        self._standard_bitmask: Dict[str, int] = {}
+        for bit, data in enumerate(self.cross_standard_mappings.values()):
+            for term in data['terms']:
+                self._standard_bitmask[term] = self._standard_bitmask.get(term, 0) | (1 << bit)
+        
+        # Cross-standard mapping entries containing each term, in mapping order
+        self._term_to_mappings: Dict[str, List[Dict]] = {}
+        for data in self.cross_standard_mappings.values():
+            for term in data['terms']:
+                mappings = self._term_to_mappings.setdefault(term, [])
+                if not mappings or mappings[-1] is not data:
+                    mappings.append(data)
+        
+        # Synonyms, parent and children of every known term fused into one
+        # neighbour tuple, so each find_related_terms step is one lookup
+        self._neighbors: Dict[str, Tuple[str, ...]] = {}
+        known_terms = (
+            *self.synonym_networks, *self.synonym_to_canonical,
+            *self.parent_child_hierarchies, *self.child_to_parent
+        )
+        for term in dict.fromkeys(known_terms):
+            neighbors = dict.fromkeys(self.get_synonyms(term))
+            parent = self.get_parent(term)
+            if parent:
+                neighbors[parent] = None
+            neighbors.update(dict.fromkeys(self.get_children(term)))
+            neighbors.pop(term, None)
+            self._neighbors[term] = tuple(neighbors)
+        
+        # Parents that represent "Total ..." lines
+        self._total_parents = frozenset(
+            parent for parent in self.parent_child_hierarchies if parent.startswith('total_')
+        )
+        
+        # Aggregate counts for generate_relationship_report
+        self._total_synonyms = sum(len(data['synonyms']) for data in self.synonym_networks.values())
+        self._total_children = sum(len(data['children']) for data in self.parent_child_hierarchies.values())
+        self._max_depth = max(map(len, self._ancestors.values()), default=0)
+        self._total_gaap = sum(len(data['gaap']) for data in self.cross_standard_mappings.values())
+        self._total_ifrs = sum(len(data['ifrs']) for data in self.cross_standard_mappings.values())
     
     def get_synonyms(self, term_key: str) -> List[str]:
         """
@@ -370,27 +542,24 @@ class RelationshipMapper:
         Returns:
             List of synonyms
         """
-        if term_key in self.synonym_networks:
-            return self.synonym_networks[term_key]['synonyms']
-        
-        # Check if it's a synonym of something else
-        if term_key in self.synonym_to_canonical:
-            canonical = self.synonym_to_canonical[term_key]
-            return self.synonym_networks[canonical]['synonyms']
-        
-        return []
+        return list(self._synonyms_for.get(term_key, ()))
     
-    def get_canonical_term(self, synonym: str) -> Optional[str]:
+    def get_canonical_term(self, synonym: str, max_edits: int = 0) -> Optional[str]:
         """
         Get canonical term for a synonym.
         
         Args:
             synonym: Synonym to look up
+            max_edits: Edit distance tolerated when there is no exact match
+                (e.g. OCR noise such as "sundry_detbors"); 0 for exact only
             
         Returns:
             Canonical term or None
         """
-        return self.synonym_to_canonical.get(synonym)
+        canonical = self.synonym_to_canonical.get(synonym)
+        if canonical is None and max_edits > 0:
+            canonical = self._synonym_trie.match_token(synonym, max_edits)
+        return canonical
     
     def get_children(self, parent_term: str) -> List[str]:
         """
@@ -403,7 +572,7 @@ class RelationshipMapper:
             List of child term keys
         """
         if parent_term in self.parent_child_hierarchies:
-            return self.parent_child_hierarchies[parent_term]['children']
+            return list(self.parent_child_hierarchies[parent_term]['children'])
         return []
     
     def get_parent(self, child_term: str) -> Optional[str]:
@@ -428,15 +597,7 @@ class RelationshipMapper:
         Returns:
             List of parent terms (immediate to root)
         """
-        parents = []
-        current = term_key
-        
-        while current in self.child_to_parent:
-            parent = self.child_to_parent[current]
-            parents.append(parent)
-            current = parent
-        
-        return parents
+        return list(self._ancestors.get(term_key, ()))
     
     def get_related_standards(self, term_key: str) -> List[Dict]:
         """
@@ -448,7 +609,38 @@ class RelationshipMapper:
         Returns:
             List of standard mappings
         """
-        return self.term_to_standards.get(term_key, [])
+        return [
+            {'indas': record['indas'], 'gaap': list(record['gaap']), 'ifrs': list(record['ifrs'])}
+            for record in self.term_to_standards.get(term_key, ())
+        ]
+    
+    def get_related_standards_bulk(self, term_keys: Sequence[str]) -> List[int]:
+        """
+        Get standard bitmasks for many terms at once.
+        
+        Masks can be combined with bitwise operators (or loaded into an
+        integer array) to filter large batches of line items.
+        
+        Args:
+            term_keys: Terms to look up
+            
+        Returns:
+            Bitmask per term (0 if unmapped); decode with decode_standards_bitmask
+        """
+        bitmask = self._standard_bitmask
+        return [bitmask.get(term_key, 0) for term_key in term_keys]
+    
+    def decode_standards_bitmask(self, mask: int) -> List[str]:
+        """
+        Get the IndAS standards whose bits are set in a mask.
+        
+        Args:
+            mask: Bitmask from get_related_standards_bulk
+            
+        Returns:
+            IndAS standard names, in mapping order
+        """
+        return [name for bit, name in enumerate(self._standard_names) if mask >> bit & 1]
     
     def get_equivalent_terms_across_standards(
         self, 
@@ -468,10 +660,9 @@ class RelationshipMapper:
         equivalents = []
         
         # Check cross-standard mappings
-        for indas_std, data in self.cross_standard_mappings.items():
-            if term_key in data['terms']:
-                if target_standard in data:
-                    equivalents.extend(data[target_standard])
+        for data in self._term_to_mappings.get(term_key, ()):
+            if target_standard in data:
+                equivalents.extend(data[target_standard])
         
         return equivalents
     
@@ -487,7 +678,8 @@ class RelationshipMapper:
         Args:
             child_term: Child term key
             parent_term: Parent term key
-            context: Optional context information
+            context: Optional context information; a precomputed 'text_lower'
+                is used when present, otherwise 'text' is lowered
             
         Returns:
             True if child should be preferred
@@ -498,9 +690,11 @@ class RelationshipMapper:
             return False
         
         # Check for "Total" prefix in context
-        if context and 'text' in context:
-            text = context['text'].lower()
-            if 'total' in text and parent_term.startswith('total_'):
+        if context and parent_term in self._total_parents:
+            text_lower = context.get('text_lower')
+            if text_lower is None and 'text' in context:
+                text_lower = context['text'].lower()
+            if text_lower and 'total' in text_lower:
                 # Keep parent if it's a total line
                 return False
         
@@ -541,36 +735,26 @@ class RelationshipMapper:
         Returns:
             List of related term keys
         """
+        if max_distance <= 0:
+            return []
+        
         related = set()
         visited = {term_key}
-        queue = [(term_key, 0)]
+        queue = deque([(term_key, 0)])
+        neighbors_of = self._neighbors
         
         while queue:
-            current, distance = queue.pop(0)
-            
-            if distance >= max_distance:
-                continue
+            current, distance = queue.popleft()
+            next_distance = distance + 1
             
-            # Get synonyms
-            for synonym in self.get_synonyms(current):
-                if synonym not in visited:
-                    visited.add(synonym)
-                    related.add(synonym)
-                    queue.append((synonym, distance + 1))
-            
-            # Get parent
-            parent = self.get_parent(current)
-            if parent and parent not in visited:
-                visited.add(parent)
-                related.add(parent)
-                queue.append((parent, distance + 1))
-            
-            # Get children
-            for child in self.get_children(current):
-                if child not in visited:
-                    visited.add(child)
-                    related.add(child)
-                    queue.append((child, distance + 1))
+            # Synonyms, parent and children; terms on the last ring are
+            # recorded but never expanded, so they are not queued
+            for neighbor in neighbors_of.get(current, ()):
+                if neighbor not in visited:
+                    visited.add(neighbor)
+                    related.add(neighbor)
+                    if next_distance < max_distance:
+                        queue.append((neighbor, next_distance))
         
         return list(related)
     
@@ -584,10 +768,7 @@ class RelationshipMapper:
         return {
             'synonym_networks': {
                 'total_networks': len(self.synonym_networks),
-                'total_synonyms': sum(
-                    len(data['synonyms']) 
-                    for data in self.synonym_networks.values()
-                ),
+                'total_synonyms': self._total_synonyms,
                 'networks': [
                     {
                         'canonical': canonical,
@@ -599,14 +780,8 @@ class RelationshipMapper:
             },
             'parent_child_hierarchies': {
                 'total_parents': len(self.parent_child_hierarchies),
-                'total_children': sum(
-                    len(data['children'])
-                    for data in self.parent_child_hierarchies.values()
-                ),
-                'max_depth': max(
-                    len(self.get_all_parents(child))
-                    for child in self.child_to_parent.keys()
-                ) if self.child_to_parent else 0,
+                'total_children': self._total_children,
+                'max_depth': self._max_depth,
                 'hierarchies': [
                     {
                         'parent': parent,
@@ -620,14 +795,14 @@ class RelationshipMapper:
                 'total_mappings': len(self.cross_standard_mappings),
                 'standards_covered': {
                     'indas': len(self.cross_standard_mappings),
-                    'gaap': sum(len(data['gaap']) for data in self.cross_standard_mappings.values()),
-                    'ifrs': sum(len(data['ifrs']) for data in self.cross_standard_mappings.values()),
+                    'gaap': self._total_gaap,
+                    'ifrs': self._total_ifrs,
                 },
                 'mappings': [
                     {
                         'indas': indas_std,
-                        'gaap': data['gaap'],
-                        'ifrs': data['ifrs'],
+                        'gaap': list(data['gaap']),
+                        'ifrs': list(data['ifrs']),
                         'term_count': len(data['terms'])
                     }
                     for indas_std, data in self.cross_standard_mappings.items()
@@ -636,20 +811,30 @@ class RelationshipMapper:
         }
 
 
+# Shared default mapper: the tables are read-only after __init__, so one
+# instance serves every convenience call in the process
+_default_mapper: Optional[RelationshipMapper] = None
+
+
+def _get_default_mapper() -> RelationshipMapper:
+    """Return the process-wide default RelationshipMapper, building it once."""
+    global _default_mapper
+    if _default_mapper is None:
+        _default_mapper = RelationshipMapper()
+    return _default_mapper
+
+
 # Convenience functions
 def get_term_synonyms(term_key: str) -> List[str]:
     """Quick function to get synonyms for a term."""
-    mapper = RelationshipMapper()
-    return mapper.get_synonyms(term_key)
+    return _get_default_mapper().get_synonyms(term_key)
 
 
 def get_term_parent(term_key: str) -> Optional[str]:
     """Quick function to get parent of a term."""
-    mapper = RelationshipMapper()
-    return mapper.get_parent(term_key)
+    return _get_default_mapper().get_parent(term_key)
 
 
 def get_related_terms(term_key: str, max_distance: int = 2) -> List[str]:
     """Quick function to get related terms."""
-    mapper = RelationshipMapper()
-    return mapper.find_related_terms(term_key, max_distance)
+    return _get_default_mapper().find_related_terms(term_key, max_distance)
@@ -1,8 +1,16 @@
 
 import sys
+import copy
+import gc
 import json
 import logging
-from typing import Dict, Any, List, Optional
+import math
+import multiprocessing as mp
+import os
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Tuple
 from pathlib import Path
 import argparse
 
@@ -10,6 +18,71 @@ import argparse
 from parser_config import ParserConfig
 from parsers import FinancialParser
 
+# Optional fast JSON encoder for result files
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+
+def _json_default(value: Any) -> Any:
+    """Convert a value the encoders have no JSON type for."""
+    if isinstance(value, float):
+        return float(value)  # float subclasses orjson does not serialize natively
+    if hasattr(value, 'tolist'):
+        return value.tolist()  # numpy scalars and arrays
+    return str(value)
+
+
+def _json_safe(value: Any) -> Any:
+    """
+    Prepare data for the stdlib encoder so it writes what orjson writes.
+    
+    NaN and infinities become None (JSON null) instead of the invalid NaN
+    token, and numpy values become their Python equivalents.
+    """
+    if isinstance(value, float):
+        return float(value) if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _json_safe(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_safe(item) for item in value]
+    if hasattr(value, 'tolist') and not isinstance(value, (str, bytes)):
+        return _json_safe(value.tolist())
+    return value
+
+
+def _json_bytes(data: Any, indent: bool = False) -> bytes:
+    """
+    Serialize data to UTF-8 JSON, using orjson when available.
+    
+    Both encoders produce the same output: numbers (numpy included) stay
+    numbers, NaN and infinities are written as null, and values JSON has no
+    type for (e.g. Decimal) are written as strings.
+    
+    Args:
+        data: JSON-compatible object
+        indent: Pretty-print with 2-space indentation
+        
+    Returns:
+        Encoded JSON bytes
+    """
+    if ORJSON_AVAILABLE:
+        option = (
+            orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+            | (orjson.OPT_INDENT_2 if indent else 0)
+        )
+        try:
+            return orjson.dumps(data, default=_json_default, option=option)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(
+        _json_safe(data), indent=2 if indent else None, ensure_ascii=False,
+        separators=None if indent else (',', ':'), default=_json_default
+    ).encode('utf-8')
+
 # =============================================================================
 # Convenience Functions
 # =============================================================================
@@ -56,16 +129,50 @@ def parse_file(
     return parser.parse(file_path, file_type)
 
 
+# Parsed reports kept for the accessors below, so asking for standalone and
+# consolidated statements (or a comparison) of one PDF parses it once. Entries
+# are keyed on path, modification time and options. Cached results are shared,
+# so the accessors hand out deep copies and never the cached dicts themselves.
+# Raise the size for large batches, or release memory with clear_parse_cache().
+PARSE_CACHE_SIZE = 8
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_annual_report_cached(
+    pdf_path: str,
+    mtime: float,
+    use_ocr: bool,
+    validate: bool
+) -> Dict[str, Any]:
+    """parse_annual_report memoized on (path, mtime, options)."""
+    return parse_annual_report(pdf_path, use_ocr, validate)
+
+
+def _get_annual_report(pdf_path: str, use_ocr: bool = True, validate: bool = True) -> Dict[str, Any]:
+    """Parse an annual report, reusing the result for an unchanged file (read-only)."""
+    try:
+        mtime = os.path.getmtime(pdf_path)
+    except OSError:
+        # Let the parser report missing/unreadable files as usual
+        return parse_annual_report(pdf_path, use_ocr, validate)
+    return _parse_annual_report_cached(str(pdf_path), mtime, use_ocr, validate)
+
+
+def clear_parse_cache():
+    """Release all parsed reports held for the convenience accessors."""
+    _parse_annual_report_cached.cache_clear()
+
+
 def get_standalone_statements(pdf_path: str) -> Dict[str, Any]:
     """Extract only standalone financial statements."""
-    result = parse_annual_report(pdf_path)
-    return result.get("standalone", {})
+    result = _get_annual_report(pdf_path)
+    return copy.deepcopy(result.get("standalone", {}))
 
 
 def get_consolidated_statements(pdf_path: str) -> Dict[str, Any]:
     """Extract only consolidated financial statements."""
-    result = parse_annual_report(pdf_path)
-    return result.get("consolidated", {})
+    result = _get_annual_report(pdf_path)
+    return copy.deepcopy(result.get("consolidated", {}))
 
 
 def compare_statements(
@@ -84,7 +191,7 @@ def compare_statements(
     Returns:
         Comparison dictionary
     """
-    result = parse_annual_report(pdf_path)
+    result = _get_annual_report(pdf_path)
     
     comparison = {
         "balance_sheet": [],
@@ -92,49 +199,162 @@ def compare_statements(
         "cash_flow": [],
     }
     
-    for stmt_type in comparison.keys():
-        items1 = {
-            item.get("label", "").lower(): item
-            for item in result.get(entity1, {}).get(stmt_type, {}).get("items", [])
-        }
-        items2 = {
-            item.get("label", "").lower(): item
-            for item in result.get(entity2, {}).get(stmt_type, {}).get("items", [])
-        }
-        
-        all_labels = set(items1.keys()) | set(items2.keys())
+    entity1_data = result.get(entity1, {})
+    entity2_data = result.get(entity2, {})
+    
+    for stmt_type, rows in comparison.items():
+        # One keymap for both entities: lowercased label -> [item1, item2]
+        merged: Dict[str, List[Optional[Dict]]] = {}
+        for item in entity1_data.get(stmt_type, {}).get("items", []):
+            merged.setdefault(item.get("label", "").lower(), [None, None])[0] = item
+        for item in entity2_data.get(stmt_type, {}).get("items", []):
+            merged.setdefault(item.get("label", "").lower(), [None, None])[1] = item
         
-        for label in sorted(all_labels):
-            item1 = items1.get(label, {})
-            item2 = items2.get(label, {})
+        for _, (item1, item2) in sorted(merged.items()):
+            item1 = item1 or {}
+            item2 = item2 or {}
             
             if item1 or item2:
-                comparison[stmt_type].append({
+                current1 = item1.get("currentYear", 0)
+                previous1 = item1.get("previousYear", 0)
+                current2 = item2.get("currentYear", 0)
+                previous2 = item2.get("previousYear", 0)
+                rows.append({
                     "label": item1.get("label") or item2.get("label"),
                     entity1: {
-                        "currentYear": item1.get("currentYear", 0),
-                        "previousYear": item1.get("previousYear", 0),
+                        "currentYear": current1,
+                        "previousYear": previous1,
                     },
                     entity2: {
-                        "currentYear": item2.get("currentYear", 0),
-                        "previousYear": item2.get("previousYear", 0),
+                        "currentYear": current2,
+                        "previousYear": previous2,
                     },
                     "difference": {
-                        "currentYear": (
-                            item2.get("currentYear", 0) - item1.get("currentYear", 0)
-                        ),
-                        "previousYear": (
-                            item2.get("previousYear", 0) - item1.get("previousYear", 0)
-                        ),
+                        "currentYear": current2 - current1,
+                        "previousYear": previous2 - previous1,
                     }
                 })
     
     return comparison
 
 
+def _parse_batch_file(
+    parser: FinancialParser,
+    file_path: str,
+    output_dir: Optional[str]
+) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Parse one batch file and optionally save it as JSON.
+    
+    Args:
+        parser: Parser to use
+        file_path: File to parse
+        output_dir: Optional directory to save the JSON output
+        
+    Returns:
+        Tuple of (result for the batch list, summary for the manifest)
+    """
+    try:
+        result = parser.parse(file_path)
+        result['_source_file'] = file_path
+        result['_status'] = 'success'
+        
+        summary = {'file': file_path}
+        if output_dir:
+            output_path = Path(output_dir) / f"{Path(file_path).stem}_parsed.json"
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(_json_bytes(result, indent=True))
+            summary['output'] = str(output_path)
+        summary['status'] = 'success'
+        summary['items_count'] = len(result.get('items', []))
+        
+        if output_dir:
+            result = summary
+        
+    except Exception as e:
+        result = summary = {
+            'file': file_path,
+            'status': 'error',
+            'error': str(e)
+        }
+    
+    return result, summary
+
+
+# Worker-process state for parallel batch_parse. Each worker builds its own
+# FinancialParser on first use, so only paths and config cross the process
+# boundary (PyMuPDF objects cannot be pickled).
+_batch_worker_config: Dict[str, Any] = {}
+_batch_worker_output_dir: Optional[str] = None
+_batch_worker_parser: Optional[FinancialParser] = None
+
+
+def _init_batch_worker(config_kwargs: Dict[str, Any], output_dir: Optional[str]):
+    """Pool initializer: remember the batch settings in this worker."""
+    global _batch_worker_config, _batch_worker_output_dir
+    _batch_worker_config = config_kwargs
+    _batch_worker_output_dir = output_dir
+
+
+def _parse_batch_file_in_worker(file_path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Pool task: parse one file with this worker's parser."""
+    global _batch_worker_parser
+    if _batch_worker_parser is None:
+        try:
+            _batch_worker_parser = FinancialParser(ParserConfig(**_batch_worker_config))
+        except Exception as e:
+            error = {'file': file_path, 'status': 'error', 'error': str(e)}
+            return error, error
+    return _parse_batch_file(_batch_worker_parser, file_path, _batch_worker_output_dir)
+
+
+# Read size used to pull a file into the page cache when fadvise is unavailable
+PREFETCH_CHUNK_SIZE = 1 << 20
+
+
+def _prefetch_file(file_path: str):
+    """Warm the OS page cache for a file ahead of parsing (best effort)."""
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        if hasattr(os, 'posix_fadvise'):
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        else:
+            while os.read(fd, PREFETCH_CHUNK_SIZE):
+                pass
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _iter_parse_serial(
+    file_paths: List[str],
+    output_dir: Optional[str],
+    config_kwargs: Dict[str, Any]
+) -> Iterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    """Parse files with one parser, prefetching the next file while the current one parses."""
+    parser = FinancialParser(ParserConfig(**config_kwargs))
+    
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        for index, file_path in enumerate(file_paths):
+            if index + 1 < len(file_paths):
+                prefetcher.submit(_prefetch_file, file_paths[index + 1])
+            yield _parse_batch_file(parser, file_path, output_dir)
+
+
+# Files parsed between explicit garbage collections in batch mode; parser
+# state leaves reference cycles that would otherwise pile up across reports
+BATCH_GC_INTERVAL = 10
+
+
 def batch_parse(
     file_paths: List[str],
     output_dir: Optional[str] = None,
+    manifest_path: Optional[str] = None,
+    max_workers: Optional[int] = None,
     **kwargs
 ) -> List[Dict[str, Any]]:
     """
@@ -143,50 +363,88 @@ def batch_parse(
     Args:
         file_paths: List of file paths
         output_dir: Optional directory to save JSON outputs
+        manifest_path: Optional NDJSON file; one summary line per file is appended
+        max_workers: Worker processes to parse files in parallel (serial if None or 1)
         **kwargs: Additional config options
         
     Returns:
-        List of results (or summary if output_dir is provided)
+        List of results (or summary if output_dir is provided), in input order
     """
-    config = ParserConfig(**kwargs)
-    parser = FinancialParser(config)
+    return list(iter_batch_parse(file_paths, output_dir, manifest_path, max_workers, **kwargs))
+
+
+def iter_batch_parse(
+    file_paths: List[str],
+    output_dir: Optional[str] = None,
+    manifest_path: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    gc_interval: int = BATCH_GC_INTERVAL,
+    **kwargs
+) -> Iterator[Dict[str, Any]]:
+    """
+    Parse multiple files, yielding each result as soon as it is ready.
     
-    results = []
+    Lets callers handle and discard full results one report at a time
+    instead of holding the whole batch in memory.
     
-    for file_path in file_paths:
-        try:
-            result = parser.parse(file_path)
-            result['_source_file'] = file_path
-            result['_status'] = 'success'
-            
-            if output_dir:
-                output_path = Path(output_dir) / f"{Path(file_path).stem}_parsed.json"
-                output_path.parent.mkdir(parents=True, exist_ok=True)
-                with open(output_path, 'w', encoding='utf-8') as f:
-                    json.dump(result, f, indent=2, ensure_ascii=False)
-                result = {
-                    'file': file_path,
-                    'output': str(output_path),
-                    'status': 'success',
-                    'items_count': len(result.get('items', []))
-                }
+    Args:
+        file_paths: List of file paths
+        output_dir: Optional directory to save JSON outputs
+        manifest_path: Optional NDJSON file; one summary line per file is appended
+        max_workers: Worker processes to parse files in parallel (serial if None or 1)
+        gc_interval: Run a garbage collection every this many files (0 disables)
+        **kwargs: Additional config options
+        
+    Yields:
+        Result (or summary if output_dir is provided) per file, in input order
+    """
+    # Opened before the pool starts, so a bad path cannot leak running workers
+    manifest = open(manifest_path, 'ab') if manifest_path else None
+    pool = None
+    exhausted = False
+    
+    try:
+        if max_workers and max_workers > 1 and len(file_paths) > 1:
+            pool = mp.Pool(
+                processes=min(max_workers, len(file_paths)),
+                initializer=_init_batch_worker,
+                initargs=(kwargs, output_dir)
+            )
+            outcomes = pool.imap(_parse_batch_file_in_worker, file_paths)
+        else:
+            outcomes = _iter_parse_serial(file_paths, output_dir, kwargs)
+        
+        for count, (result, summary) in enumerate(outcomes, 1):
+            if manifest:
+                manifest.write(_json_bytes(summary) + b"\n")
             
-            results.append(result)
+            yield result
+            result = summary = None
             
-        except Exception as e:
-            results.append({
-                'file': file_path,
-                'status': 'error',
-                'error': str(e)
-            })
-    
-    return results
+            if gc_interval and count % gc_interval == 0:
+                gc.collect()
+        exhausted = True
+    finally:
+        if manifest:
+            manifest.close()
+        if pool:
+            # A consumer that stops early (break, exception, close()) should
+            # not wait for the remaining files to be parsed
+            if exhausted:
+                pool.close()
+            else:
+                pool.terminate()
+            pool.join()
 
 
 # =============================================================================
 # CLI
 # =============================================================================
 
+# Key item row: label, current year, previous year, variation
+_KEY_ITEM_ROW = "       • {:<40} {:>15,.2f} {:>15,.2f} {:>10}".format
+
+
 def print_statement_summary(name: str, data: Dict):
     """Print formatted statement summary."""
     items = data.get("items", [])
@@ -203,28 +461,28 @@ def print_statement_summary(name: str, data: Dict):
     print(f"    📊 Items: {len(items)}")
     
     # Show key totals
-    print("    📈 Key Items:")
-    for item in items:
-        if item.get("isImportant") or item.get("isTotal"):
-            label = item.get("label", "")[:40]
-            curr = item.get("currentYear", 0)
-            prev = item.get("previousYear", 0)
-            var_pct = item.get("variationPercent", 0)
-            
-            if var_pct is None:
-                var_str = "N/A"
-            elif var_pct > 0:
-                var_str = f"+{var_pct:.1f}%"
-            else:
-                var_str = f"{var_pct:.1f}%"
-            
-            print(f"       • {label:<40} {curr:>15,.2f} {prev:>15,.2f} {var_str:>10}")
+    key_items = [item for item in items if item.get("isImportant") or item.get("isTotal")]
+    lines = ["    📈 Key Items:"]
+    for item in key_items:
+        label = item.get("label", "")[:40]
+        curr = item.get("currentYear", 0)
+        prev = item.get("previousYear", 0)
+        var_pct = item.get("variationPercent", 0)
+        
+        if var_pct is None:
+            var_str = "N/A"
+        elif var_pct > 0:
+            var_str = f"+{var_pct:.1f}%"
+        else:
+            var_str = f"{var_pct:.1f}%"
+        
+        lines.append(_KEY_ITEM_ROW(label, curr, prev, var_str))
+    print("\n".join(lines))
 
 
-def main():
-    """Main CLI entry point."""
-    import argparse
-    
+@lru_cache(maxsize=1)
+def _build_arg_parser() -> argparse.ArgumentParser:
+    """Build the CLI argument parser (once per process)."""
     parser = argparse.ArgumentParser(
         description='Enhanced Financial Statement Parser for NSE/BSE Annual Reports',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -258,10 +516,18 @@ Examples:
                        help='Validate output (default: enabled)')
     parser.add_argument('--batch', '-b', action='store_true',
                        help='Batch processing mode')
+    parser.add_argument('--workers', '-w', type=int, default=None,
+                       help='Worker processes for batch parsing (default: serial); each worker '
+                            'loads its own parser, so memory grows with the count')
     parser.add_argument('--quiet', '-q', action='store_true',
                        help='Quiet mode (minimal output)')
     
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main CLI entry point."""
+    args = _build_arg_parser().parse_args()
     
     # Build config
     use_ocr = not args.no_ocr
@@ -274,24 +540,31 @@ Examples:
     
     # Batch mode
     if args.batch or len(args.files) > 1:
-        results = batch_parse(args.files, args.output, **config.to_dict())
+        # Serial unless --workers opts in: every worker builds its own parser
+        # (OCR and matching engines) and pickles full results back
+        results = batch_parse(
+            args.files, args.output, max_workers=args.workers, **config.to_dict()
+        )
         
         print(f"\n{'='*80}")
         print("📦 BATCH PROCESSING RESULTS")
         print(f"{'='*80}")
         
-        success = sum(1 for r in results if r.get('status') == 'success')
+        status_counts = Counter(r.get('status') for r in results)
+        success = status_counts['success']
         failed = len(results) - success
         
         print(f"\n  ✅ Successful: {success}")
         print(f"  ❌ Failed: {failed}")
         
-        if not args.quiet:
+        if not args.quiet and results:
+            lines = []
             for result in results:
                 status = "✅" if result.get('status') == 'success' else "❌"
                 file_name = Path(result.get('file', '')).name
                 items = result.get('items_count', 'N/A')
-                print(f"  {status} {file_name}: {items} items")
+                lines.append(f"  {status} {file_name}: {items} items")
+            print("\n".join(lines))
         
         return
     
@@ -312,7 +585,13 @@ Examples:
     
     # Output
     if args.json:
-        print(json.dumps(result, indent=2, ensure_ascii=False))
+        buffer = getattr(sys.stdout, 'buffer', None)
+        if buffer is None:
+            print(_json_bytes(result, indent=True).decode('utf-8'))
+        else:
+            sys.stdout.flush()
+            buffer.write(_json_bytes(result, indent=True) + b'\n')
+            buffer.flush()
         return
     
     if args.output:
@@ -320,8 +599,7 @@ Examples:
         if output_path.is_dir():
             output_path = output_path / f"{Path(file_path).stem}_parsed.json"
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        output_path.write_bytes(_json_bytes(result, indent=True))
         print(f"✅ Output saved to: {output_path}")
         return
     
@@ -353,19 +631,19 @@ Examples:
     # Statements
     for entity in ["standalone", "consolidated"]:
         entity_data = result.get(entity, {})
-        has_data = any(
-            entity_data.get(st, {}).get("items")
-            for st in ["balance_sheet", "income_statement", "cash_flow"]
-        )
+        statements = {
+            st: entity_data.get(st) or {}
+            for st in ("balance_sheet", "income_statement", "cash_flow")
+        }
         
-        if has_data:
+        if any(stmt.get("items") for stmt in statements.values()):
             print(f"\n{'─'*80}")
             print(f"📑 {entity.upper()} FINANCIAL STATEMENTS")
             print(f"{'─'*80}")
             
-            for stmt_name in ["balance_sheet", "income_statement", "cash_flow"]:
+            for stmt_name, stmt_data in statements.items():
                 print(f"\n  {stmt_name.replace('_', ' ').upper()}:")
-                print_statement_summary(stmt_name, entity_data.get(stmt_name, {}))
+                print_statement_summary(stmt_name, stmt_data)
     
     # Summary
     all_items = result.get("items", [])
@@ -374,10 +652,9 @@ Examples:
     print(f"{'─'*80}")
     print(f"  Total Line Items: {len(all_items)}")
     
-    standalone_count = sum(1 for i in all_items if i.get("reportingEntity") == "standalone")
-    consolidated_count = sum(1 for i in all_items if i.get("reportingEntity") == "consolidated")
-    print(f"  Standalone Items: {standalone_count}")
-    print(f"  Consolidated Items: {consolidated_count}")
+    entity_counts = Counter(i.get("reportingEntity") for i in all_items)
+    print(f"  Standalone Items: {entity_counts['standalone']}")
+    print(f"  Consolidated Items: {entity_counts['consolidated']}")
     
     # Validation
     validation = metadata.get("validation", {})
@@ -402,18 +679,23 @@ Examples:
         
         for stmt_type, items in comparison.items():
             if items:
-                print(f"\n{stmt_type.replace('_', ' ').upper()}:")
-                print(f"{'Label':<40} {'Standalone':>15} {'Consolidated':>15} {'Difference':>15}")
-                print("-" * 90)
+                lines = [
+                    f"\n{stmt_type.replace('_', ' ').upper()}:",
+                    f"{'Label':<40} {'Standalone':>15} {'Consolidated':>15} {'Difference':>15}",
+                    "-" * 90
+                ]
                 
                 for item in items[:15]:
-                    label = item.get("label", "")[:38]
                     s_curr = item.get("standalone", {}).get("currentYear", 0)
                     c_curr = item.get("consolidated", {}).get("currentYear", 0)
-                    diff = item.get("difference", {}).get("currentYear", 0)
+                    if s_curr == 0 and c_curr == 0:
+                        continue
                     
-                    if s_curr != 0 or c_curr != 0:
-                        print(f"{label:<40} {s_curr:>15,.2f} {c_curr:>15,.2f} {diff:>15,.2f}")
+                    label = item.get("label", "")[:38]
+                    diff = item.get("difference", {}).get("currentYear", 0)
+                    lines.append(f"{label:<40} {s_curr:>15,.2f} {c_curr:>15,.2f} {diff:>15,.2f}")
+                
+                print("\n".join(lines))
 
 
 if __name__ == "__main__":
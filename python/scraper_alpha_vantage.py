@@ -7,16 +7,97 @@ Get free API key at: https://www.alphavantage.co/support/#api-key
 """
 
 import requests
-import json
+from requests.adapters import HTTPAdapter
 import logging
 import os
+from contextvars import ContextVar
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
+# Optional fast JSON decoder for API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Import cache
+try:
+    from cache_manager import CompanySearchCache, CACHE_DIR
+    CACHE_AVAILABLE = True
+except ImportError:
+    CACHE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 ALPHA_VANTAGE_BASE = "https://www.alphavantage.co/query"
 
+# Connection pool shared by every scraper session, so new scrapers reuse
+# open keep-alive connections instead of repeating the TLS handshake
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+
+# Seconds company overviews are served from the local cache
+ALPHA_VANTAGE_DETAILS_CACHE_TTL = 86400
+
+_details_cache: Optional['CompanySearchCache'] = None
+
+
+def _get_details_cache() -> 'CompanySearchCache':
+    """Get the on-disk Alpha Vantage company overview cache"""
+    global _details_cache
+    if _details_cache is None:
+        _details_cache = CompanySearchCache(
+            CACHE_DIR / "alpha_vantage_details_cache.json", ALPHA_VANTAGE_DETAILS_CACHE_TTL
+        )
+    return _details_cache
+
+
+@dataclass(frozen=True)
+class AlphaVantageCredentials:
+    """Alpha Vantage API credentials"""
+    api_key: Optional[str] = None
+
+
+# Override for the current context (e.g. one web request); None uses the environment
+_current_credentials: ContextVar[Optional[AlphaVantageCredentials]] = ContextVar(
+    '_alpha_vantage_credentials', default=None
+)
+
+
+def set_credentials(credentials: Optional[AlphaVantageCredentials]):
+    """Set credentials for scrapers created in the current context (None restores the environment)"""
+    _current_credentials.set(credentials)
+
+
+def _get_credentials() -> AlphaVantageCredentials:
+    """Get the credentials in effect for the current context"""
+    # The environment is read on each call, so keys set after import
+    # (e.g. by load_dotenv) are picked up
+    return _current_credentials.get() or AlphaVantageCredentials(os.getenv('ALPHA_VANTAGE_API_KEY'))
+
+
+def _safe_decode(response: requests.Response) -> Tuple[Any, Optional[str]]:
+    """
+    Decode a JSON response body, using orjson when available.
+    
+    Returns:
+        Tuple of (decoded data, None) or (None, error message)
+    """
+    # HTML error pages (gateway errors, captchas) never parse; skip the decoder
+    if response.headers.get('Content-Type', '').startswith('text/html'):
+        logger.error("Alpha Vantage returned an HTML page instead of JSON")
+        return None, "Alpha Vantage returned invalid data"
+    
+    try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(response.content), None
+        return response.json(), None
+    except ValueError:
+        logger.error("Alpha Vantage returned invalid JSON")
+        return None, "Alpha Vantage returned invalid data"
+
 
 @dataclass
 class AlphaVantageCompany:
@@ -52,9 +133,11 @@ class AlphaVantageScraper:
     Note: Requires free API key (25 calls/day on free tier)
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache: bool = True):
         self.session = requests.Session()
-        self.api_key = api_key or os.getenv('ALPHA_VANTAGE_API_KEY')
+        self.session.mount('https://', _HTTP_ADAPTER)
+        self.api_key = api_key or _get_credentials().api_key
+        self.use_cache = cache and CACHE_AVAILABLE
         
         if not self.api_key:
             logger.warning("Alpha Vantage API key not provided. Get free key at: https://www.alphavantage.co/support/#api-key")
@@ -94,11 +177,9 @@ class AlphaVantageScraper:
                 logger.warning(f"Alpha Vantage search failed: {response.status_code}")
                 return [], f"Alpha Vantage API Error: HTTP {response.status_code}"
             
-            try:
-                data = response.json()
-            except json.JSONDecodeError:
-                logger.error(f"Alpha Vantage returned invalid JSON")
-                return [], "Alpha Vantage returned invalid data"
+            data, error = _safe_decode(response)
+            if error:
+                return [], error
             
             # Check for API limit message
             if 'Note' in data and 'API call frequency' in data['Note']:
@@ -138,6 +219,11 @@ class AlphaVantageScraper:
         if not self.api_key:
             return None
         
+        if self.use_cache:
+            cached = _get_details_cache().get(symbol)
+            if cached:
+                return AlphaVantageCompany(**cached[0])
+        
         try:
             # Alpha Vantage company overview API
             params = {
@@ -151,13 +237,13 @@ class AlphaVantageScraper:
             if response.status_code != 200:
                 return None
             
-            data = response.json()
+            data, error = _safe_decode(response)
             
-            # Check for API limit or error
-            if 'Note' in data or 'Error Message' in data:
+            # Check for invalid data, API limit or error
+            if error or 'Note' in data or 'Error Message' in data:
                 return None
             
-            return AlphaVantageCompany(
+            company = AlphaVantageCompany(
                 symbol=symbol,
                 name=data.get('Name', symbol),
                 isin='',
@@ -166,6 +252,11 @@ class AlphaVantageScraper:
                 market_cap=float(data.get('MarketCapitalization', 0)) if data.get('MarketCapitalization') else None
             )
             
+            if self.use_cache:
+                _get_details_cache().set(symbol, [company.to_dict()])
+            
+            return company
+            
         except Exception as e:
             logger.error(f"Error getting Alpha Vantage company details: {e}")
             return None
@@ -196,10 +287,10 @@ class AlphaVantageScraper:
             if response.status_code != 200:
                 return None
             
-            data = response.json()
+            data, error = _safe_decode(response)
             
-            # Check for API limit or error
-            if 'Note' in data or 'Error Message' in data:
+            # Check for invalid data, API limit or error
+            if error or 'Note' in data or 'Error Message' in data:
                 return None
             
             quote = data.get('Global Quote', {})
@@ -219,13 +310,24 @@ class AlphaVantageScraper:
 
 
 # Convenience functions
+@lru_cache(maxsize=8)
+def _scraper_for(api_key: Optional[str]) -> AlphaVantageScraper:
+    """Get a shared scraper per API key"""
+    return AlphaVantageScraper(api_key)
+
+
+def _get_scraper(api_key: Optional[str]) -> AlphaVantageScraper:
+    """Get the shared scraper for an explicit or current-context API key"""
+    return _scraper_for(api_key or _get_credentials().api_key)
+
+
 def search_alpha_vantage_companies(query: str, api_key: Optional[str] = None, limit: int = 10) -> Tuple[List[AlphaVantageCompany], Optional[str]]:
     """Search companies on Alpha Vantage"""
-    scraper = AlphaVantageScraper(api_key)
+    scraper = _get_scraper(api_key)
     return scraper.search_companies(query, limit)
 
 
 def get_alpha_vantage_company_info(symbol: str, api_key: Optional[str] = None) -> Optional[AlphaVantageCompany]:
     """Get company information from Alpha Vantage"""
-    scraper = AlphaVantageScraper(api_key)
+    scraper = _get_scraper(api_key)
     return scraper.get_company_details(symbol)
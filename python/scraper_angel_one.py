@@ -9,16 +9,188 @@ Note: Angel One API requires authentication and provides excellent coverage of I
 """
 
 import requests
+import base64
+import hashlib
 import json
 import logging
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import ContextVar
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 
+# Optional fast JSON decoder for API responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
+# Import cache
+try:
+    from cache_manager import CompanySearchCache, CACHE_DIR
+    CACHE_AVAILABLE = True
+except ImportError:
+    CACHE_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 ANGEL_ONE_API_BASE = "https://apiconnect.angelbroking.com/rest/secure"
 
+# Connection pool shared by every scraper session, so new scrapers reuse
+# open keep-alive connections instead of repeating the TLS handshake
+_HTTP_ADAPTER = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+
+# Seconds an access token is reused when its JWT carries no expiry claim
+ANGEL_ONE_TOKEN_TTL = 3600
+
+# Tokens closer than this many seconds to expiry are not reused
+ANGEL_ONE_TOKEN_MIN_VALIDITY = 60
+
+# Upper bound on how long a token stays in the on-disk store
+ANGEL_ONE_TOKEN_STORE_TTL = 86400
+
+# Error codes Angel One returns for an invalid, expired or missing access token
+ANGEL_ONE_AUTH_ERROR_CODES = frozenset({'AG8001', 'AG8002', 'AG8003'})
+
+# Exchanges searched concurrently by search_companies, in result order
+SEARCH_EXCHANGES = ('NSE', 'BSE')
+
+# Seconds search results are served from the local cache
+ANGEL_ONE_SEARCH_CACHE_TTL = 3600
+
+_search_cache: Optional['CompanySearchCache'] = None
+
+
+def _get_search_cache() -> 'CompanySearchCache':
+    """Get the on-disk Angel One search cache"""
+    global _search_cache
+    if _search_cache is None:
+        _search_cache = CompanySearchCache(
+            CACHE_DIR / "angel_one_search_cache.json", ANGEL_ONE_SEARCH_CACHE_TTL
+        )
+    return _search_cache
+
+
+_token_store: Optional['CompanySearchCache'] = None
+
+
+def _get_token_store() -> 'CompanySearchCache':
+    """Get the on-disk access token store shared by all processes (an owner-only file)"""
+    global _token_store
+    if _token_store is None:
+        _token_store = CompanySearchCache(
+            CACHE_DIR / "angel_one_auth_cache.json", ANGEL_ONE_TOKEN_STORE_TTL
+        )
+    return _token_store
+
+
+def _token_store_key(credentials: Tuple[str, str, str]) -> str:
+    """Key a token in the on-disk store by a hash of its credentials"""
+    return hashlib.sha256(':'.join(credentials).encode('utf-8')).hexdigest()
+
+
+def _stored_token(store_key: str) -> Optional[Tuple[str, float]]:
+    """
+    Read an access token from the on-disk store.
+    
+    Args:
+        store_key: Hash of the credentials the token belongs to
+        
+    Returns:
+        Tuple of (token, expires at), or None if missing or malformed
+    """
+    stored = _get_token_store().get(store_key)
+    try:
+        token, expires_at = stored[0]['token'], float(stored[0]['expires_at'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return None
+    return (token, expires_at) if isinstance(token, str) and token else None
+
+
+def _is_auth_failure(response: requests.Response) -> bool:
+    """Check whether Angel One rejected the access token sent with a request"""
+    if response.status_code in (401, 403):
+        return True
+    # Only decode bodies that can carry one of the AG80xx error codes
+    if b'AG80' not in response.content:
+        return False
+    data, error = _safe_decode(response)
+    return not error and isinstance(data, dict) and data.get('errorcode') in ANGEL_ONE_AUTH_ERROR_CODES
+
+
+def _token_expiry(access_token: str) -> float:
+    """
+    Get when an access token expires.
+    
+    Args:
+        access_token: JWT returned by loginByPassword
+        
+    Returns:
+        Expiry as a Unix timestamp (from the exp claim, or ANGEL_ONE_TOKEN_TTL from now)
+    """
+    try:
+        payload = access_token.split('.')[1]
+        claims = json.loads(base64.urlsafe_b64decode(payload + '=' * (-len(payload) % 4)))
+        return float(claims['exp'])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return time.time() + ANGEL_ONE_TOKEN_TTL
+
+
+@dataclass(frozen=True)
+class AngelOneCredentials:
+    """Angel One Smart API credentials"""
+    api_key: Optional[str] = None
+    client_code: Optional[str] = None
+    password: Optional[str] = None
+
+
+# Override for the current context (e.g. one web request); None uses the environment
+_current_credentials: ContextVar[Optional[AngelOneCredentials]] = ContextVar(
+    '_angel_one_credentials', default=None
+)
+
+
+def set_credentials(credentials: Optional[AngelOneCredentials]):
+    """Set credentials for scrapers created in the current context (None restores the environment)"""
+    _current_credentials.set(credentials)
+
+
+def _get_credentials() -> AngelOneCredentials:
+    """Get the credentials in effect for the current context"""
+    # The environment is read on each call, so credentials set after import
+    # (e.g. by load_dotenv) are picked up
+    return _current_credentials.get() or AngelOneCredentials(
+        os.getenv('ANGEL_ONE_API_KEY'),
+        os.getenv('ANGEL_ONE_CLIENT_CODE'),
+        os.getenv('ANGEL_ONE_PASSWORD')
+    )
+
+
+def _safe_decode(response: requests.Response) -> Tuple[Any, Optional[str]]:
+    """
+    Decode a JSON response body, using orjson when available.
+    
+    Returns:
+        Tuple of (decoded data, None) or (None, error message)
+    """
+    # HTML error pages (gateway errors, captchas) never parse; skip the decoder
+    if response.headers.get('Content-Type', '').startswith('text/html'):
+        logger.error("Angel One returned an HTML page instead of JSON")
+        return None, "Angel One returned invalid data"
+    
+    try:
+        if ORJSON_AVAILABLE:
+            return orjson.loads(response.content), None
+        return response.json(), None
+    except ValueError:
+        logger.error("Angel One returned invalid JSON")
+        return None, "Angel One returned invalid data"
+
 
 @dataclass
 class AngelOneCompany:
@@ -56,13 +228,20 @@ class AngelOneScraper:
     Note: Requires Angel One API credentials (API key, client code, and password)
     """
     
+    # Access tokens shared across instances: credentials -> (token, expires at)
+    _token_cache: Dict[Tuple[str, str, str], Tuple[str, float]] = {}
+    
     def __init__(self, api_key: Optional[str] = None, client_code: Optional[str] = None,
-                 password: Optional[str] = None):
+                 password: Optional[str] = None, cache: bool = True):
         self.session = requests.Session()
-        self.api_key = api_key or os.getenv('ANGEL_ONE_API_KEY')
-        self.client_code = client_code or os.getenv('ANGEL_ONE_CLIENT_CODE')
-        self.password = password or os.getenv('ANGEL_ONE_PASSWORD')
+        self.session.mount('https://', _HTTP_ADAPTER)
+        credentials = _get_credentials()
+        self.api_key = api_key or credentials.api_key
+        self.client_code = client_code or credentials.client_code
+        self.password = password or credentials.password
         self.access_token: Optional[str] = None
+        self._token_expires_at = 0.0
+        self.use_cache = cache and CACHE_AVAILABLE
         
         if not self.api_key or not self.client_code or not self.password:
             logger.warning("Angel One API credentials not provided. Get access at: https://www.angelone.in/smartapi")
@@ -78,11 +257,33 @@ class AngelOneScraper:
                 'X-MACAddress': 'MAC_ADDRESS',
                 'X-PrivateKey': self.api_key
             })
-            # Try to authenticate
-            self._authenticate()
+            # Authentication is deferred to the first API call
+    
+    def _ensure_auth(self) -> bool:
+        """Authenticate on first use or once the token expires; returns True if a token is available"""
+        if self.access_token and self._token_expires_at - time.time() > ANGEL_ONE_TOKEN_MIN_VALIDITY:
+            return True
+        if not self.api_key or not self.client_code or not self.password:
+            return False
+        return self._authenticate()
     
     def _authenticate(self) -> bool:
         """Authenticate with Angel One API and get access token"""
+        credentials = (self.api_key, self.client_code, self.password)
+        cached = self._token_cache.get(credentials)
+        if cached and cached[1] - time.time() > ANGEL_ONE_TOKEN_MIN_VALIDITY:
+            self._set_access_token(*cached)
+            return True
+        
+        # Tokens stored by other processes, keyed by a hash of the credentials
+        store_key = _token_store_key(credentials)
+        if self.use_cache:
+            stored = _stored_token(store_key)
+            if stored and stored[1] - time.time() > ANGEL_ONE_TOKEN_MIN_VALIDITY:
+                self._set_access_token(*stored)
+                self._token_cache[credentials] = stored
+                return True
+        
         try:
             auth_url = "https://apiconnect.angelbroking.com/rest/auth/angelbroking/user/v1/loginByPassword"
             
@@ -94,13 +295,17 @@ class AngelOneScraper:
             response = self.session.post(auth_url, json=payload, timeout=10)
             
             if response.status_code == 200:
-                data = response.json()
-                if data.get('status'):
-                    self.access_token = data.get('data', {}).get('jwtToken')
-                    if self.access_token:
-                        self.session.headers.update({
-                            'Authorization': f'Bearer {self.access_token}'
-                        })
+                data, error = _safe_decode(response)
+                if not error and data.get('status'):
+                    access_token = data.get('data', {}).get('jwtToken')
+                    if access_token:
+                        expires_at = _token_expiry(access_token)
+                        self._set_access_token(access_token, expires_at)
+                        self._token_cache[credentials] = (access_token, expires_at)
+                        if self.use_cache:
+                            _get_token_store().set(
+                                store_key, [{'token': access_token, 'expires_at': expires_at}]
+                            )
                         logger.info("Angel One authentication successful")
                         return True
                 
@@ -111,6 +316,47 @@ class AngelOneScraper:
             logger.error(f"Error authenticating with Angel One: {e}")
             return False
     
+    def _post(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        """
+        POST an authenticated request, logging in again once if the token was rejected.
+        
+        A session can be revoked before its JWT expires (e.g. by a newer login),
+        so a rejected token is dropped from the shared caches and replaced.
+        """
+        used_token = self.access_token
+        response = self.session.post(url, json=payload, timeout=10)
+        if _is_auth_failure(response):
+            logger.info("Angel One rejected the access token; logging in again")
+            self._invalidate_token(used_token)
+            if self._authenticate():
+                response = self.session.post(url, json=payload, timeout=10)
+        return response
+    
+    def _invalidate_token(self, access_token: Optional[str]):
+        """Forget a rejected token here, in the shared cache and in the on-disk store"""
+        credentials = (self.api_key, self.client_code, self.password)
+        # Only drop entries still holding the rejected token; a concurrent
+        # request may already have stored a fresh one
+        cached = self._token_cache.get(credentials)
+        if cached and cached[0] == access_token:
+            del self._token_cache[credentials]
+        if self.use_cache:
+            store_key = _token_store_key(credentials)
+            stored = _stored_token(store_key)
+            if stored and stored[0] == access_token:
+                _get_token_store().delete(store_key)
+        if self.access_token == access_token:
+            self.access_token = None
+            self._token_expires_at = 0.0
+    
+    def _set_access_token(self, access_token: str, expires_at: float):
+        """Use access token for subsequent requests"""
+        self.access_token = access_token
+        self._token_expires_at = expires_at
+        self.session.headers.update({
+            'Authorization': f'Bearer {self.access_token}'
+        })
+    
     def search_companies(self, query: str, limit: int = 10) -> Tuple[List[AngelOneCompany], Optional[str]]:
         """
         Search for companies on Angel One (Indian markets only).
@@ -125,57 +371,57 @@ class AngelOneScraper:
         if not self.api_key or not self.client_code:
             return [], "Angel One API credentials not configured"
         
-        if not self.access_token:
+        cache_key = f"{query.strip()}|{limit}"
+        if self.use_cache:
+            cached = _get_search_cache().get(cache_key)
+            if cached:
+                return [AngelOneCompany(**company) for company in cached], None
+        
+        if not self._ensure_auth():
             return [], "Angel One authentication failed"
         
         try:
-            # Angel One search API - search across NSE and BSE
-            url = f"{ANGEL_ONE_API_BASE}/angelbroking/order/v1/searchScrip"
-            
-            payload = {
-                'exchange': 'NSE',  # Can be NSE, BSE, NFO, etc.
-                'searchscrip': query
-            }
+            # Search every exchange concurrently; each call is one round trip
+            with ThreadPoolExecutor(max_workers=len(SEARCH_EXCHANGES)) as executor:
+                outcomes = list(executor.map(
+                    lambda exchange: self._search_exchange(exchange, query), SEARCH_EXCHANGES
+                ))
             
-            try:
-                response = self.session.post(url, json=payload, timeout=10)
-            except requests.Timeout:
-                logger.error(f"Angel One search timeout for query: {query}")
-                return [], "Angel One Connection Timed Out"
-            except requests.ConnectionError:
-                logger.error(f"Angel One connection error for query: {query}")
-                return [], "Angel One Connection Failed"
-            
-            if response.status_code != 200:
-                logger.warning(f"Angel One search failed: {response.status_code}")
-                return [], f"Angel One API Error: HTTP {response.status_code}"
-            
-            try:
-                data = response.json()
-            except json.JSONDecodeError:
-                logger.error(f"Angel One returned invalid JSON")
-                return [], "Angel One returned invalid data"
-            
-            # Check for API errors
-            if not data.get('status'):
-                error_msg = data.get('message', 'Unknown error')
-                logger.warning(f"Angel One API error: {error_msg}")
-                return [], f"Angel One API error: {error_msg}"
+            errors = [error for _, error in outcomes if error]
+            if len(errors) == len(outcomes):
+                return [], errors[0]
             
             companies = []
+            seen = set()
+            
+            # Parse search results, dropping scrips listed by more than one search
+            for rows, _ in outcomes:
+                for symbol_data in rows:
+                    get = symbol_data.get
+                    exchange = get('exchange', 'ANGEL_ONE')
+                    # Tokens arrive as ints or strings; the API expects strings
+                    key = (exchange, str(get('token', '')))
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    
+                    trading_symbol = get('tradingsymbol', '')
+                    companies.append(AngelOneCompany(
+                        symbol=trading_symbol,
+                        name=get('name', trading_symbol),
+                        isin='',
+                        sector='',
+                        industry='',
+                        exchange=exchange,
+                        token=key[1]
+                    ))
+                    if len(companies) >= limit:
+                        break
+                if len(companies) >= limit:
+                    break
             
-            # Parse search results
-            for symbol_data in data.get('data', [])[:limit]:
-                company = AngelOneCompany(
-                    symbol=symbol_data.get('tradingsymbol', ''),
-                    name=symbol_data.get('name', symbol_data.get('tradingsymbol', '')),
-                    isin='',
-                    sector='',
-                    industry='',
-                    exchange=symbol_data.get('exchange', 'ANGEL_ONE'),
-                    token=str(symbol_data.get('token', ''))
-                )
-                companies.append(company)
+            if self.use_cache and companies:
+                _get_search_cache().set(cache_key, [company.to_dict() for company in companies])
             
             return companies, None
             
@@ -183,6 +429,49 @@ class AngelOneScraper:
             logger.error(f"Error searching Angel One companies: {e}")
             return [], f"Angel One Internal Error: {str(e)}"
     
+    def _search_exchange(self, exchange: str, query: str) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Search scrips on one exchange.
+        
+        Args:
+            exchange: Exchange to search (NSE, BSE, NFO, etc.)
+            query: Company name or symbol to search
+            
+        Returns:
+            Tuple of (List of raw scrip records, Error message or None)
+        """
+        url = f"{ANGEL_ONE_API_BASE}/angelbroking/order/v1/searchScrip"
+        
+        payload = {
+            'exchange': exchange,
+            'searchscrip': query
+        }
+        
+        try:
+            response = self._post(url, payload)
+        except requests.Timeout:
+            logger.error(f"Angel One search timeout for query: {query} ({exchange})")
+            return [], "Angel One Connection Timed Out"
+        except requests.ConnectionError:
+            logger.error(f"Angel One connection error for query: {query} ({exchange})")
+            return [], "Angel One Connection Failed"
+        
+        if response.status_code != 200:
+            logger.warning(f"Angel One search failed: {response.status_code}")
+            return [], f"Angel One API Error: HTTP {response.status_code}"
+        
+        data, error = _safe_decode(response)
+        if error:
+            return [], error
+        
+        # Check for API errors
+        if not data.get('status'):
+            error_msg = data.get('message', 'Unknown error')
+            logger.warning(f"Angel One API error: {error_msg}")
+            return [], f"Angel One API error: {error_msg}"
+        
+        return data.get('data') or [], None
+    
     def get_stock_quote(self, symbol: str, token: str, exchange: str = 'NSE') -> Optional[Dict[str, Any]]:
         """
         Get stock quote for a company.
@@ -195,57 +484,103 @@ class AngelOneScraper:
         Returns:
             Dictionary with stock quote data or None
         """
-        if not self.access_token:
-            return None
+        return self.get_stock_quotes([(symbol, token, exchange)]).get(symbol)
+    
+    def get_stock_quotes(self, entries: List[Tuple[str, str, str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get stock quotes for several companies in one request.
+        
+        Args:
+            entries: (symbol, token, exchange) tuples
+            
+        Returns:
+            Dictionary of symbol -> stock quote data (symbols without a quote are omitted)
+        """
+        if not entries or not self._ensure_auth():
+            return {}
         
         try:
-            # Angel One market data API
+            # Angel One market data API accepts a token list per exchange
             url = f"{ANGEL_ONE_API_BASE}/angelbroking/market/v1/quote"
             
+            exchange_tokens: Dict[str, List[str]] = {}
+            symbols_by_token: Dict[Tuple[str, str], str] = {}
+            for symbol, token, exchange in entries:
+                token = str(token)
+                exchange_tokens.setdefault(exchange, []).append(token)
+                symbols_by_token[(exchange, token)] = symbol
+            
             payload = {
                 'mode': 'FULL',
-                'exchangeTokens': {
-                    exchange: [token]
-                }
+                'exchangeTokens': exchange_tokens
             }
             
-            response = self.session.post(url, json=payload, timeout=10)
+            response = self._post(url, payload)
             
             if response.status_code != 200:
-                return None
+                return {}
             
-            data = response.json()
+            data, error = _safe_decode(response)
             
-            # Check for API errors
-            if not data.get('status'):
-                return None
+            # Check for invalid data and API errors
+            if error or not data.get('status'):
+                return {}
             
-            quote_data = data.get('data', {}).get('fetched', [{}])[0]
+            fetched = data.get('data', {}).get('fetched', [{}])
             
-            return {
-                'symbol': symbol,
-                'price': quote_data.get('ltp'),  # Last traded price
-                'change': quote_data.get('change'),
-                'change_percent': quote_data.get('percentChange'),
-                'open': quote_data.get('open'),
-                'high': quote_data.get('high'),
-                'low': quote_data.get('low'),
-                'close': quote_data.get('close'),
-                'volume': quote_data.get('volume'),
-                'exchange': exchange
-            }
+            quotes = {}
+            for quote_data in fetched:
+                exchange = quote_data.get('exchange')
+                symbol = symbols_by_token.get((exchange, str(quote_data.get('symbolToken'))))
+                if symbol is None:
+                    if len(entries) != 1:
+                        continue
+                    # Single lookup: the quote returned is the one asked for
+                    symbol, _, exchange = entries[0]
+                quotes[symbol] = {
+                    'symbol': symbol,
+                    'price': quote_data.get('ltp'),  # Last traded price
+                    'change': quote_data.get('change'),
+                    'change_percent': quote_data.get('percentChange'),
+                    'open': quote_data.get('open'),
+                    'high': quote_data.get('high'),
+                    'low': quote_data.get('low'),
+                    'close': quote_data.get('close'),
+                    'volume': quote_data.get('volume'),
+                    'exchange': exchange
+                }
+            
+            return quotes
             
         except Exception as e:
-            logger.error(f"Error getting Angel One stock quote: {e}")
-            return None
+            logger.error(f"Error getting Angel One stock quotes: {e}")
+            return {}
 
 
 # Convenience functions
+@lru_cache(maxsize=8)
+def _scraper_for(api_key: Optional[str], client_code: Optional[str],
+                 password: Optional[str]) -> AngelOneScraper:
+    """Get a shared scraper per set of credentials"""
+    return AngelOneScraper(api_key, client_code, password)
+
+
+def _get_scraper(api_key: Optional[str], client_code: Optional[str],
+                 password: Optional[str]) -> AngelOneScraper:
+    """Get the shared scraper for explicit or current-context credentials"""
+    credentials = _get_credentials()
+    return _scraper_for(
+        api_key or credentials.api_key,
+        client_code or credentials.client_code,
+        password or credentials.password
+    )
+
+
 def search_angel_one_companies(query: str, api_key: Optional[str] = None,
                                client_code: Optional[str] = None, password: Optional[str] = None,
                                limit: int = 10) -> Tuple[List[AngelOneCompany], Optional[str]]:
     """Search companies on Angel One"""
-    scraper = AngelOneScraper(api_key, client_code, password)
+    scraper = _get_scraper(api_key, client_code, password)
     return scraper.search_companies(query, limit)
 
 
@@ -253,5 +588,5 @@ def get_angel_one_stock_quote(symbol: str, token: str, exchange: str = 'NSE',
                               api_key: Optional[str] = None, client_code: Optional[str] = None,
                               password: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Get stock quote from Angel One"""
-    scraper = AngelOneScraper(api_key, client_code, password)
+    scraper = _get_scraper(api_key, client_code, password)
     return scraper.get_stock_quote(symbol, token, exchange)
@@ -9,6 +9,14 @@ import json
 import logging
 from typing import Dict, List, Any, Optional
 
+# Optional fast JSON encoder for bridge responses
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
 # Import scrapers
@@ -69,12 +77,13 @@ class ScraperBridge:
             
             # Perform search
             results, errors = self.company_search.search(query, exch, limit)
+            result_dicts = [r.to_dict() for r in results]
             
             # Log to DB
             if db:
                 try:
                     db.save_scraper_result(query, 'BOTH', 'SEARCH', {
-                        'results': [r.to_dict() for r in results],
+                        'results': result_dicts,
                         'errors': errors
                     })
                 except Exception as db_err:
@@ -85,7 +94,7 @@ class ScraperBridge:
                 'query': query,
                 'exchange': exchange,
                 'count': len(results),
-                'results': [r.to_dict() for r in results],
+                'results': result_dicts,
                 'errors': errors
             }
             
@@ -130,16 +139,18 @@ class ScraperBridge:
             result = self.company_search.get_company_details(symbol, exch)
             
             if result:
+                company = result.to_dict()
+                
                 # Log to DB
                 if db:
                     try:
-                        db.save_scraper_result(symbol, exchange, 'DETAILS', result.to_dict())
+                        db.save_scraper_result(symbol, exchange, 'DETAILS', company)
                     except Exception as db_err:
                         logger.error(f"DB Log Error: {db_err}")
                         
                 return {
                     'success': True,
-                    'company': result.to_dict()
+                    'company': company
                 }
             else:
                 return {
@@ -283,6 +294,16 @@ def get_bridge() -> ScraperBridge:
     return _bridge
 
 
+def _dumps(data: Dict[str, Any]) -> str:
+    """Serialize a bridge response to a JSON string, using orjson when available."""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits; the stdlib encoder handles them
+    return json.dumps(data, ensure_ascii=False)
+
+
 # Convenience functions for direct calling
 def search_companies_bridge(query: str, exchange: str = "BOTH", limit: int = 10) -> str:
     """
@@ -298,7 +319,7 @@ def search_companies_bridge(query: str, exchange: str = "BOTH", limit: int = 10)
     """
     bridge = get_bridge()
     result = bridge.search_companies(query, exchange, limit)
-    return json.dumps(result, ensure_ascii=False)
+    return _dumps(result)
 
 
 def get_company_details_bridge(symbol: str, exchange: str) -> str:
@@ -314,7 +335,7 @@ def get_company_details_bridge(symbol: str, exchange: str) -> str:
     """
     bridge = get_bridge()
     result = bridge.get_company_details(symbol, exchange)
-    return json.dumps(result, ensure_ascii=False)
+    return _dumps(result)
 
 
 def get_stock_quote_bridge(symbol: str, exchange: str) -> str:
@@ -330,7 +351,7 @@ def get_stock_quote_bridge(symbol: str, exchange: str) -> str:
     """
     bridge = get_bridge()
     result = bridge.get_stock_quote(symbol, exchange)
-    return json.dumps(result, ensure_ascii=False)
+    return _dumps(result)
 
 
 def search_web_bridge(query: str) -> str:
@@ -345,7 +366,7 @@ def search_web_bridge(query: str) -> str:
     """
     bridge = get_bridge()
     result = bridge.search_web(query)
-    return json.dumps(result, ensure_ascii=False)
+    return _dumps(result)
 
 
 def get_scraper_status_bridge() -> str:
@@ -357,4 +378,4 @@ def get_scraper_status_bridge() -> str:
     """
     bridge = get_bridge()
     result = bridge.get_exchanges_status()
-    return json.dumps(result, ensure_ascii=False)
+    return _dumps(result)
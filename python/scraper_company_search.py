@@ -84,7 +84,7 @@ class Exchange(Enum):
     ALL = "ALL"
 
 
-@dataclass
+@dataclass(frozen=True)
 class CompanyResult:
     """Unified company search result"""
     name: str
@@ -99,6 +99,15 @@ class CompanyResult:
     additional_data: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict[str, Any]:
+        # Fields are frozen, so the dict is built once; the cache is a plain
+        # attribute (not a field, so asdict() skips it) and callers get a copy
+        cached = self.__dict__.get('_dict')
+        if cached is None:
+            cached = self._build_dict()
+            object.__setattr__(self, '_dict', cached)
+        return dict(cached)
+    
+    def _build_dict(self) -> Dict[str, Any]:
         return {
             'name': self.name,
             'symbol': self.symbol,
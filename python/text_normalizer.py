@@ -1,7 +1,7 @@
+import calendar
 import re
 import unicodedata
 from typing import Dict, List, Tuple, Optional, Any
-from datetime import datetime
 
 # =============================================================================
 # ABBREVIATIONS & SYNONYMS (Consolidated from abbreviations.py and more)
@@ -81,6 +81,9 @@ SIGN_INDICATORS = {
 # Date patterns (simplified for normalization)
 DATE_PATTERN = re.compile(r'\b(\d{1,2})[./-](\d{1,2})[./-](\d{2,4})\b')
 
+# Days per month in a common year (February gains a day in leap years)
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
 # =============================================================================
 # NORMALIZATION PIPELINE
 # =============================================================================
@@ -141,12 +144,13 @@ class TextNormalizer:
             d, m, y = match.groups()
             if len(y) == 2:
                 y = "20" + y # Assumption for financial docs
-            try:
-                # Basic validation
-                dt = datetime(int(y), int(m), int(d))
-                return dt.strftime('%Y-%m-%d')
-            except ValueError:
+            year, month, day = int(y), int(m), int(d)
+            # Basic validation, without building a datetime
+            if not (year >= 1 and 1 <= month <= 12 and day >= 1):
+                return match.group(0)
+            if day > DAYS_IN_MONTH[month - 1] and not (month == 2 and day == 29 and calendar.isleap(year)):
                 return match.group(0)
+            return f'{year}-{month:02d}-{day:02d}'
         
         return DATE_PATTERN.sub(replace_date, text)
 
@@ -0,0 +1,86 @@
+
+import unittest
+import sys
+import os
+
+# Add python directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../python')))
+
+from preprocessing import TextPreprocessor, PARALLEL_BATCH_THRESHOLD
+
+
+class TestTextPreprocessor(unittest.TestCase):
+    def setUp(self):
+        self.preprocessor = TextPreprocessor()
+
+    def test_note_dots_and_parenthetical_cleanup(self):
+        result = self.preprocessor.preprocess("Trade Receivables (Note 5) ..... (1,234) 567", 3)
+        self.assertEqual(result.cleaned_text, "trade receivables -1234 567")
+        self.assertEqual(result.canonical_form, "trade receivables -1234 -567")
+        self.assertEqual(result.sign_multiplier, -1)
+        self.assertEqual(result.removed_elements['notes'], ['note_ref:(Note 5)'])
+        self.assertEqual(result.removed_elements['numbers'], ['1,234'])
+        self.assertEqual(result.metadata['line_number'], 3)
+
+    def test_dots_joined_by_removed_reference(self):
+        result = self.preprocessor.preprocess("Revenue..(Note 12)...(1,234)")
+        self.assertEqual(result.cleaned_text, "revenue -1234")
+        self.assertEqual(result.removed_elements['notes'], ['note_ref:(Note 12)'])
+        self.assertEqual(result.removed_elements['numbers'], ['1,234'])
+        self.assertEqual(self.preprocessor.preprocess("Revenue..(Note 12)...(5)").cleaned_text, "revenue")
+
+    def test_schedule_reference_and_date(self):
+        result = self.preprocessor.preprocess("Cash and cash equivalents Schedule A 31.03.2023")
+        self.assertEqual(result.canonical_form, "cash and cash equivalents 2023-03-31")
+        self.assertEqual(result.removed_elements['notes'], ['schedule_ref:Schedule A'])
+        self.assertEqual(result.removed_elements['dates'], ['2023-03-31'])
+
+    def test_normalize_dates_month_end(self):
+        normalize = self.preprocessor._normalize_dates
+        self.assertEqual(normalize("as at 29.02.2024"), ("as at 2024-02-29", ["2024-02-29"]))
+        self.assertEqual(normalize("as at 29.02.2023"), ("as at 29.02.2023", []))
+        self.assertEqual(normalize("as at 31-04-2023"), ("as at 31-04-2023", []))
+        self.assertEqual(normalize("as at 1.4.23"), ("as at 2023-04-01", ["2023-04-01"]))
+
+    def test_indian_number_format(self):
+        result = self.preprocessor.preprocess("Less: Depreciation 1,00,000")
+        self.assertEqual(result.canonical_form, "less depreciation -100000")
+        self.assertEqual(result.removed_elements['sign_indicators'], ['negative_indicator'])
+
+    def test_abbreviation_expansion(self):
+        result = self.preprocessor.preprocess("PP&E (see note 12) 12.5")
+        self.assertEqual(result.cleaned_text, "property plant equipment 12.5")
+        self.assertEqual(result.detected_abbreviations, ['ppe'])
+        self.assertEqual(result.sign_multiplier, 1)
+
+    def test_repeated_lines_are_independent(self):
+        first = self.preprocessor.preprocess("Total (Note 3)", 1)
+        first.removed_elements['notes'].append('mutated')
+        second = self.preprocessor.preprocess("  Total (Note 3)  ", 2)
+        self.assertEqual(second.removed_elements['notes'], ['note_ref:(Note 3)'])
+        self.assertEqual(second.metadata['line_number'], 2)
+
+    def test_removals_not_tracked(self):
+        preprocessor = TextPreprocessor({'track_removals': False})
+        result = preprocessor.preprocess("Trade Receivables (Note 5) (1,234)")
+        self.assertEqual(result.canonical_form, "trade receivables -1234")
+        self.assertEqual(result.removed_elements['notes'], ())
+        self.assertEqual(result.to_dict()['removed_elements']['numbers'], [])
+
+    def test_parallel_batch_removals_not_tracked(self):
+        preprocessor = TextPreprocessor({'track_removals': False})
+        lines = ["Trade Receivables (Note 5) (1,234)"] * PARALLEL_BATCH_THRESHOLD
+        results = preprocessor.preprocess_batch(lines, max_workers=2)
+        self.assertEqual(len(results), PARALLEL_BATCH_THRESHOLD)
+        self.assertEqual(results[-1].canonical_form, "trade receivables -1234")
+        self.assertEqual(results[-1].removed_elements['notes'], ())
+        self.assertEqual(results[-1].metadata['line_number'], PARALLEL_BATCH_THRESHOLD)
+
+    def test_sign_indicator_variants(self):
+        self.assertEqual(self.preprocessor.preprocess("(cr.) Provision 45").sign_multiplier, -1)
+        self.assertEqual(self.preprocessor.preprocess("Dr. Advances 10").sign_multiplier, 1)
+        self.assertEqual(self.preprocessor.preprocess("Revenue 100").sign_multiplier, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
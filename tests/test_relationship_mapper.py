@@ -0,0 +1,76 @@
+
+import unittest
+import sys
+import os
+
+# Add python directory to path
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '../python')))
+
+from relationship_mapper import RelationshipMapper, get_term_synonyms, get_term_parent, get_related_terms
+
+
+class TestRelationshipMapper(unittest.TestCase):
+    def setUp(self):
+        self.mapper = RelationshipMapper()
+
+    def test_synonyms_and_canonical(self):
+        self.assertIn('sundry_debtors', self.mapper.get_synonyms('trade_receivables'))
+        self.assertEqual(self.mapper.get_synonyms('sundry_debtors'), self.mapper.get_synonyms('trade_receivables'))
+        self.assertEqual(self.mapper.get_canonical_term('sundry_debtors'), 'trade_receivables')
+        self.assertEqual(self.mapper.get_synonyms('unknown_term'), [])
+
+    def test_approximate_canonical_lookup(self):
+        self.assertIsNone(self.mapper.get_canonical_term('sundry_detbors'))
+        self.assertEqual(self.mapper.get_canonical_term('sundry_detbors', max_edits=2), 'trade_receivables')
+        self.assertEqual(self.mapper.get_canonical_term('sundry_debtors', max_edits=2), 'trade_receivables')
+        self.assertIsNone(self.mapper.get_canonical_term('goodwill_impairment', max_edits=1))
+
+    def test_hierarchy(self):
+        self.assertEqual(self.mapper.get_parent('trade_receivables'), 'total_current_assets')
+        self.assertEqual(self.mapper.get_all_parents('trade_receivables'), ['total_current_assets', 'total_assets'])
+        self.assertEqual(self.mapper.get_term_specificity_score('trade_receivables'), 25)
+
+    def test_returned_lists_are_copies(self):
+        self.mapper.get_synonyms('trade_receivables').append('mutated')
+        self.mapper.get_children('total_assets').clear()
+        self.mapper.get_related_standards('contract_assets')[0]['gaap'].append('mutated')
+        other = RelationshipMapper()
+        self.assertNotIn('mutated', other.get_synonyms('trade_receivables'))
+        self.assertIn('total_current_assets', other.get_children('total_assets'))
+        self.assertNotIn('mutated', other.get_related_standards('contract_assets')[0]['gaap'])
+
+    def test_prefer_child_does_not_modify_context(self):
+        context = {'text': 'Total current assets'}
+        self.assertFalse(self.mapper.should_prefer_child_over_parent('trade_receivables', 'total_current_assets', context))
+        self.assertEqual(context, {'text': 'Total current assets'})
+        context['text'] = 'Trade receivables'
+        self.assertTrue(self.mapper.should_prefer_child_over_parent('trade_receivables', 'total_current_assets', context))
+
+    def test_related_standards_bulk(self):
+        masks = self.mapper.get_related_standards_bulk(['contract_assets', 'unknown_term'])
+        self.assertEqual(masks[1], 0)
+        self.assertEqual(
+            self.mapper.decode_standards_bitmask(masks[0]),
+            [record['indas'] for record in self.mapper.get_related_standards('contract_assets')]
+        )
+        self.assertIn('IndAS 115', self.mapper.decode_standards_bitmask(masks[0]))
+
+    def test_find_related_terms(self):
+        self.assertEqual(self.mapper.find_related_terms('trade_receivables', 0), [])
+        related = set(self.mapper.find_related_terms('trade_receivables', 1))
+        self.assertIn('total_current_assets', related)
+        self.assertIn('sundry_debtors', related)
+        self.assertNotIn('total_assets', related)
+        self.assertIn('total_assets', self.mapper.find_related_terms('trade_receivables', 2))
+
+    def test_convenience_functions(self):
+        self.assertEqual(get_term_synonyms('trade_payables'), self.mapper.get_synonyms('trade_payables'))
+        self.assertEqual(get_term_parent('trade_payables'), self.mapper.get_parent('trade_payables'))
+        self.assertEqual(
+            sorted(get_related_terms('trade_payables', 1)),
+            sorted(self.mapper.find_related_terms('trade_payables', 1))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()